@@ -1,9 +1,20 @@
 """Falcon audit module."""
 # flake8: noqa
 # first-party
+from falcon_provider_audit.aggregate import AggregatingAuditProvider
+from falcon_provider_audit.coalesce import CoalescingAuditProvider
+from falcon_provider_audit.limits import AuditLimits
 from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.partition import PartitionedFileAuditProvider
+from falcon_provider_audit.redact import AuditRedaction
+from falcon_provider_audit.ring import RingBufferAuditProvider, RingBufferResource
+from falcon_provider_audit.shipper import HttpBatchAuditProvider
 from falcon_provider_audit.utils import (
     AuditProvider,
+    AuditRequestStream,
+    AuditStream,
+    AuditStreamReader,
+    AuditTimer,
     RotatingLoggerAuditProvider,
     SyslogAuditProvider,
 )
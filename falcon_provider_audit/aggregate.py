@@ -0,0 +1,430 @@
+"""Falcon audit aggregate module."""
+# standard library
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from multiprocessing import resource_tracker, shared_memory
+
+# first-party
+from falcon_provider_audit.utils import AuditProvider
+
+try:
+    # standard library
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# get logger
+logger = logging.getLogger(__name__)
+
+# the key values used for events that do not fit in the aggregates
+OVERFLOW_VALUE = '__other__'
+
+
+class AggregateStore:
+    """In-memory aggregate store.
+
+    Each aggregate is a list containing the count, sum, min, max, and a count for each bucket
+    (plus +Inf) of the value field.
+
+    Args:
+        buckets: The histogram bucket upper bounds for the value field.
+        max_keys: The maximum number of keys per interval.
+    """
+
+    def __init__(self, buckets: tuple, max_keys: int | None = None):
+        """Initialize class properties"""
+        self.buckets = buckets
+        self.max_keys = max_keys
+
+        self._aggregates: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self._window_start = time.time()
+
+    def add(self, key: tuple, value: float | None) -> None:
+        """Add the value to the aggregate for the key.
+
+        Args:
+            key: The values of the key fields.
+            value: The value of the value field.
+        """
+        with self._lock:
+            aggregate = self._aggregates.get(key)
+            if aggregate is None:
+                if self.max_keys is not None and len(self._aggregates) >= self.max_keys:
+                    key = (OVERFLOW_VALUE,) * len(key)
+                    aggregate = self._aggregates.get(key)
+                if aggregate is None:
+                    aggregate = [0, 0, None, None] + [0] * (len(self.buckets) + 1)
+                    self._aggregates[key] = aggregate
+
+            aggregate[0] += 1
+            if isinstance(value, (int, float)):
+                self.update(aggregate, value)
+
+    def drain(self) -> tuple[float, float, dict] | None:
+        """Return and reset the aggregates.
+
+        Returns:
+            tuple: The window start, window end, and the aggregates by key.
+        """
+        with self._lock:
+            aggregates, self._aggregates = self._aggregates, {}
+            window_start, self._window_start = self._window_start, time.time()
+        return window_start, self._window_start, aggregates
+
+    def update(self, aggregate: list, value: float) -> None:
+        """Update the sum, min, max, and histogram of the aggregate with the value.
+
+        Args:
+            aggregate: The count, sum, min, max, and bucket counts.
+            value: The value of the value field.
+        """
+        aggregate[1] += value
+        if aggregate[2] is None or value < aggregate[2]:
+            aggregate[2] = value
+        if aggregate[3] is None or value > aggregate[3]:
+            aggregate[3] = value
+        aggregate[4 + bisect_left(self.buckets, value)] += 1
+
+
+class SharedMemoryAggregateStore:
+    """Shared memory aggregate store for pre-fork worker processes.
+
+    The aggregates are stored in a fixed layout hash table in a named shared memory segment
+    that is created by the first process and attached by every other process. Updates use
+    striped locks (a thread lock and a fcntl byte range lock on the lock file per stripe). The
+    first process that obtains the flusher lock is elected to drain the aggregates, if that
+    process exits the lock is released by the OS and another process is elected.
+
+    Args:
+        name: The name of the shared memory segment.
+        buckets: The histogram bucket upper bounds for the value field.
+        slots: The number of aggregate slots (the maximum number of keys per interval).
+        key_bytes: The maximum size of the JSON encoded key.
+        stripes: The number of lock stripes.
+        lock_file: The lock file (defaults to <tempdir>/<name>.lock).
+    """
+
+    magic = b'AUDITAG1'
+    header = struct.Struct('<8sIIId')
+    max_probes = 16
+
+    def __init__(
+        self,
+        name: str,
+        buckets: tuple,
+        slots: int | None = 4096,
+        key_bytes: int | None = 256,
+        stripes: int | None = 64,
+        lock_file: str | None = None,
+    ):
+        """Initialize class properties"""
+        if fcntl is None:  # pragma: no cover
+            raise RuntimeError('Shared memory aggregation requires fcntl (POSIX).')
+
+        self.buckets = buckets
+        self.name = name
+        self.slots = slots
+        self.key_bytes = key_bytes
+        self.stripes = stripes
+
+        # key hash, key length, key, count, value count, sum, min, max, bucket counts
+        self.slot = struct.Struct(f'<QH{key_bytes}sqqddd{len(buckets) + 1}q')
+        self._elected = False
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._fd = os.open(
+            lock_file or os.path.join(tempfile.gettempdir(), f'{name}.lock'),
+            os.O_RDWR | os.O_CREAT,
+            0o600,
+        )
+        self.shm = self._attach()
+        os.register_at_fork(after_in_child=self._reset_locks)
+
+    def _attach(self) -> shared_memory.SharedMemory:
+        """Create or attach the shared memory segment."""
+        size = self.header.size + self.slots * self.slot.size
+        try:
+            shm = shared_memory.SharedMemory(name=self.name, create=True, size=size)
+            self.header.pack_into(
+                shm.buf, 0, self.magic, self.slots, self.key_bytes, len(self.buckets), time.time()
+            )
+        except FileExistsError:
+            shm = shared_memory.SharedMemory(name=self.name)
+            magic, slots, key_bytes, buckets, _ = self.header.unpack_from(shm.buf, 0)
+            if magic == self.magic and (slots, key_bytes, buckets) != (
+                self.slots,
+                self.key_bytes,
+                len(self.buckets),
+            ):
+                shm.close()
+                raise ValueError(f'Shared memory segment {self.name} has a different layout.')
+
+        # the segment lifetime is managed by unlink(), not by the process that created it
+        resource_tracker.unregister(shm._name, 'shared_memory')  # pylint: disable=protected-access
+        return shm
+
+    def _reset_locks(self) -> None:
+        """Reset the thread locks in a forked child process."""
+        self._elected = False
+        self._locks = [threading.Lock() for _ in range(self.stripes)]
+
+    def add(self, key: tuple, value: float | None) -> None:
+        """Add the value to the aggregate for the key.
+
+        Args:
+            key: The values of the key fields.
+            value: The value of the value field.
+        """
+        key_data = json.dumps(key, default=str).encode()
+        if len(key_data) > self.key_bytes:
+            key_data = json.dumps((OVERFLOW_VALUE,) * len(key)).encode()
+
+        key_hash = int.from_bytes(hashlib.blake2b(key_data, digest_size=8).digest(), 'little')
+        key_hash = key_hash or 1  # zero is used for empty slots
+        index = key_hash % self.slots
+        for probe in range(min(self.max_probes, self.slots)):
+            if self._add_slot((index + probe) % self.slots, key_hash, key_data, value):
+                return
+
+        # the table is full, add the value to the overflow aggregate
+        if key_data != json.dumps((OVERFLOW_VALUE,) * len(key)).encode():
+            self.add((OVERFLOW_VALUE,) * len(key), value)
+
+    def _add_slot(self, index: int, key_hash: int, key_data: bytes, value: float | None) -> bool:
+        """Add the value to the slot if the slot is empty or contains the key."""
+        offset = self.header.size + index * self.slot.size
+        stripe = index % self.stripes
+        with self._locks[stripe]:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, 1, 1 + stripe)
+            try:
+                data = list(self.slot.unpack_from(self.shm.buf, offset))
+                if data[0] == 0:
+                    data[0:3] = [key_hash, len(key_data), key_data]
+                elif data[0] != key_hash or data[2][: data[1]] != key_data:
+                    return False
+
+                data[3] += 1
+                if isinstance(value, (int, float)):
+                    data[5] += value
+                    data[6] = value if data[4] == 0 else min(data[6], value)
+                    data[7] = value if data[4] == 0 else max(data[7], value)
+                    data[4] += 1
+                    data[8 + bisect_left(self.buckets, value)] += 1
+                self.slot.pack_into(self.shm.buf, offset, *data)
+                return True
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, 1 + stripe)
+
+    def close(self) -> None:
+        """Close the shared memory segment and lock file."""
+        self.shm.close()
+        os.close(self._fd)
+
+    def drain(self) -> tuple[float, float, dict] | None:
+        """Return and reset the aggregates if this process is the elected flusher.
+
+        Returns:
+            tuple|None: The window start, window end, and the aggregates by key or None if
+                another process is the elected flusher.
+        """
+        if not self.elect():
+            return None
+
+        start = self.header.size
+        for lock in self._locks:
+            lock.acquire()
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.stripes, 1)
+        try:
+            table = bytes(self.shm.buf[start:])
+            self.shm.buf[start:] = bytes(len(table))
+            window_start = self.header.unpack_from(self.shm.buf, 0)[4]
+            window_end = time.time()
+            struct.pack_into('<d', self.shm.buf, self.header.size - 8, window_end)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.stripes, 1)
+            for lock in self._locks:
+                lock.release()
+
+        aggregates = {}
+        for data in self.slot.iter_unpack(table):
+            if data[3] == 0:
+                continue
+            key = tuple(json.loads(data[2][: data[1]]))
+            value_set = data[4] > 0
+            aggregates[key] = [
+                data[3],
+                data[5],
+                data[6] if value_set else None,
+                data[7] if value_set else None,
+                *data[8:],
+            ]
+        return window_start, window_end, aggregates
+
+    def elect(self) -> bool:
+        """Return True if this process is (or is now) the elected flusher."""
+        if not self._elected:
+            try:
+                fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, 0)
+                self._elected = True
+            except OSError:
+                pass
+        return self._elected
+
+    def unlink(self) -> None:
+        """Remove the shared memory segment."""
+        self.shm.unlink()
+
+
+class AggregatingAuditProvider(AuditProvider):
+    """Aggregating Audit Provider.
+
+    Instead of writing every audit event, events are grouped by the values of the key fields and
+    counters are kept for each group. On each interval a summary event is written to the
+    downstream provider for each group containing the key fields, the count, and the sum, min,
+    max, and histogram (le_<bucket> counts) of the value field.
+
+    When shared_memory_name is provided the aggregates are kept in a shared memory segment that
+    is shared by all worker processes (e.g., gunicorn workers) on the host and a single elected
+    process writes the summary events (see SharedMemoryAggregateStore).
+
+    .. code:: python
+
+        provider = AggregatingAuditProvider(
+            audit_control=audit_control,
+            provider=RotatingLoggerAuditProvider(filename='audit-summary.log'),
+            key_fields=['request_path', 'request_method', 'response_status', 'user_id'],
+            value_field='request_duration_ms',
+            interval=60,
+        )
+
+    Args:
+        audit_control: A default audit control object.
+        provider: The provider that the summary events are written.
+        key_fields: The labels of the event fields used to group the events.
+        value_field: The label of a numeric event field (e.g., request_duration_ms).
+        buckets: The histogram bucket upper bounds for the value field.
+        interval: The number of seconds between flushes. If None, flush() must be called.
+        max_keys: The maximum number of groups per interval. Events for additional groups are
+            counted in a group with all key fields set to "__other__".
+        shared_memory_name: The name of the shared memory segment for the aggregates.
+    """
+
+    overflow_value = OVERFLOW_VALUE
+
+    def __init__(
+        self,
+        audit_control: dict | None = None,
+        provider: AuditProvider | None = None,
+        key_fields: list[str] | None = None,
+        value_field: str | None = None,
+        buckets: list[float] | None = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000),
+        interval: int | None = 60,
+        max_keys: int | None = 10_000,
+        shared_memory_name: str | None = None,
+    ):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        self.provider = provider
+        self.key_fields = tuple(key_fields or [])
+        self.value_field = value_field
+        self.buckets = tuple(sorted(buckets or []))
+        self.interval = interval
+        self.max_keys = max_keys
+
+        # property
+        self._name = 'aggregate'
+
+        if shared_memory_name is not None:
+            # the hash table is sized at twice max_keys to keep the probe sequences short
+            self.store = SharedMemoryAggregateStore(
+                shared_memory_name, self.buckets, slots=(max_keys or 2048) * 2
+            )
+        else:
+            self.store = AggregateStore(self.buckets, max_keys)
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if interval:
+            self._thread = threading.Thread(
+                name='audit_aggregate', target=self._flush_interval, daemon=True
+            )
+            self._thread.start()
+
+    def _flush_interval(self) -> None:
+        """Flush the aggregates on each interval until closed."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to flush audit aggregates.')
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event to the aggregates.
+
+        Args:
+            event: The event data.
+        """
+        key = tuple(self.hashable(event.get(field)) for field in self.key_fields)
+        value = event.get(self.value_field) if self.value_field is not None else None
+        self.store.add(key, value)
+
+    def close(self) -> None:
+        """Stop the flush thread and flush the remaining aggregates."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def flush(self) -> int:
+        """Write a summary event for each group to the downstream provider.
+
+        Returns:
+            int: The number of summary events written.
+        """
+        drained = self.store.drain()
+        if drained is None:
+            # another process is the elected flusher
+            return 0
+
+        window_start, window_end, aggregates = drained
+        for key, aggregate in aggregates.items():
+            self.provider.add_event(self.summary(key, aggregate, window_start, window_end))
+        return len(aggregates)
+
+    @staticmethod
+    def hashable(value: object) -> object:
+        """Return a hashable value for the key (e.g., access_route is a list)."""
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    def summary(self, key: tuple, aggregate: list, window_start: float, window_end: float) -> dict:
+        """Return the summary event for the group.
+
+        Args:
+            key: The values of the key fields.
+            aggregate: The count, sum, min, max, and bucket counts.
+            window_start: The start of the interval as seconds since the epoch.
+            window_end: The end of the interval as seconds since the epoch.
+
+        Returns:
+            dict: The summary event.
+        """
+        event = dict(zip(self.key_fields, key))
+        event['count'] = aggregate[0]
+        event['window_start'] = window_start
+        event['window_end'] = window_end
+        if self.value_field is not None:
+            event[f'{self.value_field}_sum'] = aggregate[1]
+            event[f'{self.value_field}_min'] = aggregate[2]
+            event[f'{self.value_field}_max'] = aggregate[3]
+            for bucket, count in zip(self.buckets + ('inf',), aggregate[4:]):
+                event[f'{self.value_field}_le_{bucket}'] = count
+        return event
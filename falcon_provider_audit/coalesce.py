@@ -0,0 +1,169 @@
+"""Falcon audit coalesce module."""
+# standard library
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+# first-party
+from falcon_provider_audit.utils import AuditProvider
+
+# get logger
+logger = logging.getLogger(__name__)
+
+
+class CoalescingAuditProvider(AuditProvider):
+    """Coalescing Audit Provider.
+
+    Identical events (ignoring the values of ignore_fields) within the window are coalesced into
+    a single event that is written to the downstream provider with a count, first_seen, and
+    last_seen value. The event data of the first event is used for the coalesced event.
+
+    The number of distinct events is bounded by max_events, when the limit is reached the least
+    recently seen event is written to the downstream provider.
+
+    .. code:: python
+
+        provider = CoalescingAuditProvider(
+            audit_control=audit_control,
+            provider=SyslogAuditProvider(host='127.0.0.1', port=5140),
+            ignore_fields=['request_duration_ms', 'request_start_time'],
+            window=10,
+        )
+
+    Args:
+        audit_control: A default audit control object.
+        provider: The provider that the coalesced events are written.
+        ignore_fields: The labels of the event fields that are not compared (e.g., timing).
+        window: The number of seconds that identical events are coalesced.
+        max_events: The maximum number of distinct events held.
+        interval: The number of seconds between checks for expired events. If None, flush()
+            must be called to write events that are not seen again.
+    """
+
+    def __init__(
+        self,
+        audit_control: dict | None = None,
+        provider: AuditProvider | None = None,
+        ignore_fields: list[str] | None = None,
+        window: float | None = 10,
+        max_events: int | None = 10_000,
+        interval: float | None = 1,
+    ):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        self.provider = provider
+        self.ignore_fields = frozenset(ignore_fields or [])
+        self.window = window
+        self.max_events = max_events
+        self.interval = interval
+
+        # property
+        self._name = 'coalesce'
+
+        # the events by key, ordered from least to most recently seen
+        self._events: OrderedDict[tuple, list] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if interval:
+            self._thread = threading.Thread(
+                name='audit_coalesce', target=self._flush_interval, daemon=True
+            )
+            self._thread.start()
+
+    def _flush_interval(self) -> None:
+        """Write the expired events on each interval until closed."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush(expired_only=True)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to flush coalesced audit events.')
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event.
+
+        Args:
+            event: The event data.
+        """
+        key = self.key(event)
+        now = time.time()
+        expired = []
+
+        with self._lock:
+            entry = self._events.get(key)
+            if entry is not None and now - entry[1] >= self.window:
+                # the window for the event has ended, start a new one
+                expired.append(self._events.pop(key))
+                entry = None
+
+            if entry is None:
+                # event, first seen, last seen, count
+                self._events[key] = [event, now, now, 1]
+                if self.max_events is not None and len(self._events) > self.max_events:
+                    expired.append(self._events.popitem(last=False)[1])
+            else:
+                entry[2] = now
+                entry[3] += 1
+                self._events.move_to_end(key)
+
+            expired.extend(self._pop_expired(now))
+
+        self._write(expired)
+
+    def close(self) -> None:
+        """Stop the flush thread and write all events."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+
+    def flush(self, expired_only: bool | None = False) -> int:
+        """Write the coalesced events to the downstream provider.
+
+        Args:
+            expired_only: If True, only events with an ended window are written.
+
+        Returns:
+            int: The number of events written.
+        """
+        with self._lock:
+            if expired_only:
+                entries = self._pop_expired(time.time())
+            else:
+                entries = list(self._events.values())
+                self._events.clear()
+        self._write(entries)
+        return len(entries)
+
+    def key(self, event: dict) -> tuple:
+        """Return the key of the event used to compare events.
+
+        Args:
+            event: The event data.
+
+        Returns:
+            tuple: The sorted label and value pairs of the compared fields.
+        """
+        return tuple(
+            (k, tuple(v) if isinstance(v, list) else v)
+            for k, v in sorted(event.items())
+            if k not in self.ignore_fields
+        )
+
+    def _pop_expired(self, now: float) -> list:
+        """Remove and return the least recently seen events with an ended window."""
+        expired = []
+        while self._events:
+            entry = next(iter(self._events.values()))
+            if now - entry[1] < self.window:
+                break
+            expired.append(self._events.popitem(last=False)[1])
+        return expired
+
+    def _write(self, entries: list) -> None:
+        """Write the coalesced events to the downstream provider."""
+        for event, first_seen, last_seen, count in entries:
+            self.provider.add_event(
+                {**event, 'count': count, 'first_seen': first_seen, 'last_seen': last_seen}
+            )
@@ -0,0 +1,139 @@
+"""Falcon audit limits module."""
+# standard library
+from collections.abc import Callable
+
+
+class AuditLimits:
+    """Enforce field and event size limits (in UTF-8 bytes) on audit events.
+
+    **Audit Control**
+
+    max_field_bytes (int): The maximum size of any string value in the event.
+    truncate (dict): A dict of label and the maximum size of the field value, which overrides
+        max_field_bytes.
+    max_event_bytes (int): The maximum size of all labels and string values in the event.
+    truncate_marker (str): The marker added to a truncated value (default "[truncated]").
+
+    The truncated_fields and truncated_events counters of the provider are incremented each time
+    a value or event is truncated.
+    """
+
+    marker = '[truncated]'
+
+    @classmethod
+    def compile(
+        cls, max_bytes: int, getter: Callable, provider: object, marker: str | None = None
+    ) -> Callable:
+        """Return a getter that truncates the value to max_bytes.
+
+        Args:
+            max_bytes: The maximum size of the value.
+            getter: The getter function for the field.
+            provider: The provider with the truncated_fields counter.
+            marker: The marker added to a truncated value.
+
+        Returns:
+            Callable: The truncating getter.
+        """
+        marker = cls.marker if marker is None else marker
+        max_bytes = int(max_bytes)
+
+        def truncate(obj: object) -> object:
+            value = getter(obj)
+            if isinstance(value, str):
+                if len(value) * 4 <= max_bytes:
+                    # fast path, the value can not exceed max_bytes even if every char is 4 bytes
+                    return value
+                truncated = cls.truncate(value, max_bytes, marker)
+            elif isinstance(value, list):
+                truncated = cls.truncate_list(value, max_bytes, marker)
+            else:
+                return value
+
+            if truncated is not value:
+                provider.truncated_fields += 1
+            return truncated
+
+        return truncate
+
+    @classmethod
+    def limit_event(cls, event: dict, max_bytes: int, marker: str | None = None) -> bool:
+        """Truncate the string values of the event to fit in max_bytes.
+
+        The labels and values are counted in order, once the budget is exhausted the remaining
+        string values are truncated.
+
+        Args:
+            event: The event data.
+            max_bytes: The maximum size of the event.
+            marker: The marker added to a truncated value.
+
+        Returns:
+            bool: True if the event was truncated.
+        """
+        marker = cls.marker if marker is None else marker
+        sizes = {k: len(k.encode()) + cls.size(v) for k, v in event.items()}
+        if sum(sizes.values()) <= max_bytes:
+            return False
+
+        remaining = max_bytes
+        for label, size in sizes.items():
+            value = event[label]
+            if size > remaining and isinstance(value, str):
+                event[label] = value = cls.truncate(value, max(remaining - len(label), 0), marker)
+                size = len(label.encode()) + cls.size(value)
+            remaining -= size
+        return True
+
+    @staticmethod
+    def size(value: object) -> int:
+        """Return the size in bytes of the value as it would be written."""
+        if isinstance(value, str):
+            return len(value.encode())
+        if isinstance(value, list):
+            return sum(len(str(v).encode()) + 1 for v in value)
+        return len(str(value))
+
+    @staticmethod
+    def truncate(value: str, max_bytes: int, marker: str) -> str:
+        """Return the value truncated to max_bytes (including the marker).
+
+        Args:
+            value: The value to truncate.
+            max_bytes: The maximum size of the value.
+            marker: The marker added to a truncated value.
+
+        Returns:
+            str: The truncated value or the original value if it fits in max_bytes.
+        """
+        data = value.encode()
+        if len(data) <= max_bytes:
+            return value
+
+        # drop any partial multibyte char at the truncation point
+        keep = max(max_bytes - len(marker.encode()), 0)
+        return data[:keep].decode(errors='ignore') + marker
+
+    @classmethod
+    def truncate_list(cls, value: list, max_bytes: int, marker: str) -> list:
+        """Return the list with the items that fit in max_bytes.
+
+        Args:
+            value: The list value (e.g., access_route).
+            max_bytes: The maximum size of all items.
+            marker: The marker added as the last item of a truncated list.
+
+        Returns:
+            list: The truncated list or the original list if it fits in max_bytes.
+        """
+        if cls.size(value) <= max_bytes:
+            return value
+
+        items, remaining = [], max_bytes - len(marker.encode())
+        for item in value:
+            remaining -= len(str(item).encode()) + 1
+            if remaining < 0:
+                break
+            items.append(item)
+        items.append(marker)
+        return items
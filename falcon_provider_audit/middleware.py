@@ -1,41 +1,95 @@
 """Falcon audit middleware module."""
+# standard library
+import hashlib
+import time
+from collections.abc import Callable
+from functools import partial
 
 # third-party
 import falcon
 
+# first-party
+from falcon_provider_audit.limits import AuditLimits
+from falcon_provider_audit.redact import AuditRedaction
+from falcon_provider_audit.utils import AuditRequestStream, AuditStream, AuditTimer
+
 
 class AuditMiddleware:
     """Audit middleware provider."""
 
-    def __init__(self, providers: list[object], user_id=None):
+    # the audit control field groups, in the order the values are added to the event
+    field_keys = ('req_fields', 'resource_fields', 'resp_fields', 'timing_fields')
+
+    def __init__(
+        self,
+        providers: list[object],
+        user_id=None,
+        stream_audit: bool | None = False,
+        stream_hash: str | None = None,
+        body_hash: str | None = None,
+        body_hash_max_bytes: int | None = None,
+    ):
         """Initialize class properties.
 
         Args:
             providers: A list of audit providers.
             user_id: The falcon resource property that contains the unique
                 username or userid that will be written in audit event.
+            stream_audit: If True, the resp.stream is wrapped to count the bytes sent and the
+                audit event is added when the stream is closed.
+            stream_hash: The hashlib algorithm name (e.g., sha256) used to hash the bytes sent
+                when stream_audit is enabled.
+            body_hash: The hashlib algorithm name (e.g., sha256) used to hash the request body
+                as it is read by the responder.
+            body_hash_max_bytes: The maximum request body size to hash.
         """
         self.providers = providers
         self.user_id = user_id
+        self.stream_audit = stream_audit
+        self.stream_hash = stream_hash
+        self.body_hash = body_hash
+        self.body_hash_max_bytes = body_hash_max_bytes
+
+        for hash_name in [body_hash, stream_hash]:
+            if hash_name is not None:
+                # fail on startup for an unsupported hash algorithm
+                hashlib.new(hash_name)
+
+        # audit plans keyed by resource id, resolved on the first request for each resource
+        self._resource_plans: dict[int, tuple | bool] = {}
+
+    def process_request(  # pylint: disable=unused-argument
+        self, req: falcon.Request, resp: falcon.Response
+    ) -> None:
+        """Process the request before routing and start the audit timer."""
+        req.context['audit_timer'] = AuditTimer(time.perf_counter_ns())
 
     def process_resource(  # pylint: disable=unused-argument
         self, req: falcon.Request, resp: falcon.Response, resource: object, params: dict
     ) -> None:
         """Process the request after routing and provide caching service."""
-        # update the audit control for the current resource
-        audit_control = {}
-        if hasattr(resource, 'audit_control') and isinstance(resource.audit_control, dict):
-            audit_control = resource.audit_control
+        timer: AuditTimer | None = req.context.get('audit_timer')
+        if timer is not None:
+            timer.resource_ns = time.perf_counter_ns()
+
+        plan = self._resource_plans.get(id(resource))
+        if plan is None:
+            plan = self.resource_plan(resource)
 
         # stop if auditing is explicitly set to False
-        if audit_control.get('enabled') is False:
+        if plan is False:
             resp.context['audit'] = False
             return
 
         resp.context['audit'] = True
-        for provider in self.providers:
-            # update audit control for each provider
-            provider.audit_control(audit_control)
+        resp.context['audit_plan'] = plan
+
+        if self.body_hash is not None and self.has_body(req):
+            # hash the request body as it is read by the responder (req.bounded_stream is
+            # lazily created from wsgi.input, so both references are replaced)
+            req.stream = req.env['wsgi.input'] = req.context['audit_body'] = AuditRequestStream(
+                req.stream, self.body_hash, self.body_hash_max_bytes
+            )
 
     def process_response(  # pylint: disable=unused-argument
         self, req: falcon.Request, resp: falcon.Response, resource: object, req_succeeded: bool
@@ -63,34 +117,363 @@ class AuditMiddleware:
                 'response_status': 'status',
             }
             'resource_fields': {'user_id': 'user_id'}
+            'timing_fields': {
+                'request_duration_ms': 'duration_ms',
+                'request_resource_time': 'resource_time',
+                'request_start_time': 'start_time',
+            },
             'provider_names': None,
         }
         """
         if resp.context.get('audit') is not True:
             return
 
-        # each provider can have different settings
+        if self.stream_audit and self.streams_body(req, resp):
+            # defer the audit event until the response stream has been sent
+            resp.stream = AuditStream.wrap(
+                resp.stream, partial(self.stream_closed, req, resp, resource), self.stream_hash
+            )
+            return
+
+        self.add_events(req, resp, resource)
+
+    @staticmethod
+    def add_events(req: falcon.Request, resp: falcon.Response, resource: object) -> None:
+        """Add the audit event to each provider in the audit plan.
+
+        The request body size and hex digest (see body_hash) are added to req.context as
+        audit_body_size and audit_body_hash so that they can be added using req_fields.
+
+        Args:
+            req: The falcon request.
+            resp: The falcon response.
+            resource: The falcon resource.
+        """
+        timer: AuditTimer | None = req.context.get('audit_timer')
+        if timer is not None:
+            timer.end_ns = time.perf_counter_ns()
+
+        body: AuditRequestStream | None = req.context.get('audit_body')
+        if body is not None:
+            req.context['audit_body_size'] = body.bytes_read
+            req.context['audit_body_hash'] = body.hexdigest
+
+        # the plan only contains active providers, each with its own compiled fields
+        sources = (req, resource, resp, timer)
+        for provider, fields, event_limit in resp.context.get('audit_plan', ()):
+            event = {label: getter(sources[i]) for label, i, getter in fields}
+            if event_limit is not None and AuditLimits.limit_event(event, *event_limit):
+                provider.truncated_events += 1
+            provider.add_event(event)
+
+    def stream_closed(
+        self, req: falcon.Request, resp: falcon.Response, resource: object, stream: AuditStream
+    ) -> None:
+        """Add the audit event after the response stream has been sent and closed.
+
+        The bytes sent and hex digest are added to resp.context as audit_stream_bytes and
+        audit_stream_hash so that they can be added to the event using resp_fields.
+
+        Args:
+            req: The falcon request.
+            resp: The falcon response.
+            resource: The falcon resource.
+            stream: The closed response stream.
+        """
+        resp.context['audit_stream_bytes'] = stream.bytes_sent
+        resp.context['audit_stream_hash'] = stream.hexdigest
+        self.add_events(req, resp, resource)
+
+    @staticmethod
+    def has_body(req: falcon.Request) -> bool:
+        """Return True if the request has a body.
+
+        Args:
+            req: The falcon request.
+
+        Returns:
+            bool: True if the request has a content-length or uses chunked transfer encoding.
+        """
+        if req.content_length:
+            return True
+        return 'chunked' in (req.get_header('transfer-encoding') or '').lower()
+
+    @staticmethod
+    def streams_body(req: falcon.Request, resp: falcon.Response) -> bool:
+        """Return True if the response body will be sent from resp.stream.
+
+        Args:
+            req: The falcon request.
+            resp: The falcon response.
+
+        Returns:
+            bool: True if the WSGI server will read (and close) resp.stream.
+        """
+        if resp.stream is None or resp.text is not None or resp.data is not None:
+            return False
+        if resp.media is not None or req.method == 'HEAD':
+            return False
+
+        # falcon does not send a body for informational, 204, and 304 responses
+        return not falcon.code_to_http_status(resp.status).startswith(('1', '204', '304'))
+
+    def resource_plan(self, resource: object) -> tuple | bool:
+        """Return the audit plan for the provided resource.
+
+        The resource audit control is resolved for each provider a single time and the result
+        is cached. Changes to the audit_control of a resource after the first request require
+        a call to reset().
+
+        Args:
+            resource: The falcon resource.
+
+        Returns:
+            tuple|bool: A (provider, fields) tuple for each active provider or False if auditing
+                is disabled for the resource.
+        """
+        plan = self._resource_plans.get(id(resource))
+        if plan is None:
+            plan = self.compile_plan(self.resource_audit_control(resource))
+            self._resource_plans[id(resource)] = plan
+        return plan
+
+    def index_routes(self, app: falcon.App) -> dict:
+        """Build the audit plan for every resource registered on the app router.
+
+        This method should be called at startup after all routes have been added. The audit
+        control of each resource is validated and compiled up front so that an invalid
+        configuration fails on startup instead of silently auditing None values.
+
+        .. code:: python
+
+            audit_middleware = AuditMiddleware(providers=providers)
+            app = falcon.App(middleware=[audit_middleware])
+            app.add_route('/users', UserResource())
+            audit_middleware.index_routes(app)
+
+        Args:
+            app: The falcon app containing the routes.
+
+        Returns:
+            dict: The audit plan for each URI template.
+
+        Raises:
+            TypeError: The app does not use the default falcon router.
+            ValueError: An unknown audit control key or field was found.
+        """
+        roots: list | None = getattr(getattr(app, '_router', None), '_roots', None)
+        if roots is None:
+            raise TypeError('Audit route index requires the default falcon router.')
+
+        index = {}
+        nodes = list(roots)
+        while nodes:
+            node = nodes.pop()
+            nodes.extend(node.children)
+            if node.resource is None:
+                continue
+
+            audit_control = self.resource_audit_control(node.resource)
+            self.validate_audit_control(
+                audit_control,
+                node.resource,
+                app._request_type,  # pylint: disable=protected-access
+                app._response_type,  # pylint: disable=protected-access
+            )
+            plan = self.compile_plan(audit_control)
+            self._resource_plans[id(node.resource)] = index[node.uri_template] = plan
+        return index
+
+    def validate_audit_control(
+        self,
+        audit_control: dict,
+        resource: object,
+        req_type: type = falcon.Request,
+        resp_type: type = falcon.Response,
+    ) -> None:
+        """Validate the resource audit control resolved for each provider.
+
+        Args:
+            audit_control: The resource audit control.
+            resource: The falcon resource.
+            req_type: The request class used by the app.
+            resp_type: The response class used by the app.
+
+        Raises:
+            ValueError: An unknown audit control key or field was found.
+        """
+        provider_names = {provider.name for provider in self.providers}
+        valid_keys = provider_names.union(*[p.audit_control_keys for p in self.providers])
+        resource_name = resource.__class__.__name__
+        sources = (req_type, resource, resp_type, AuditTimer)
+
         for provider in self.providers:
-            if provider.enabled is False:
-                # skip disabled providers
+            provider_control: dict = provider.resolve_audit_control(audit_control)
+            unknown_keys = sorted(set(provider_control) - valid_keys)
+            if unknown_keys:
+                raise ValueError(
+                    f'Invalid audit control key(s) {unknown_keys} for resource {resource_name} '
+                    f'and provider {provider.name}.'
+                )
+
+            if audit_control.get('enabled') is False or not provider.is_active(provider_control):
+                # fields are never extracted for a disabled resource or inactive provider
                 continue
 
-            event_data = {}
+            labels = set()
+            for i, key in enumerate(self.field_keys):
+                for label, field in (provider_control.get(key) or {}).items():
+                    labels.add(label)
+                    if not hasattr(sources[i], self.key_value(field)[0]):
+                        raise ValueError(
+                            f'Invalid audit field {label}="{field}" in {key} for resource '
+                            f'{resource_name} and provider {provider.name}.'
+                        )
+
+            for key in ['redact', 'truncate']:
+                unknown_labels = sorted(set(provider_control.get(key) or {}) - labels)
+                if unknown_labels:
+                    raise ValueError(
+                        f'Invalid {key} label(s) {unknown_labels} for resource {resource_name} '
+                        f'and provider {provider.name}.'
+                    )
+
+    @staticmethod
+    def resource_audit_control(resource: object) -> dict:
+        """Return the audit control defined on the resource.
+
+        Args:
+            resource: The falcon resource.
+
+        Returns:
+            dict: The resource audit control or an empty dict.
+        """
+        audit_control = getattr(resource, 'audit_control', None)
+        if not isinstance(audit_control, dict):
+            return {}
+        return audit_control
+
+    def compile_plan(self, audit_control: dict) -> tuple | bool:
+        """Return the audit plan for the provided resource audit control.
+
+        Args:
+            audit_control: The resource audit control.
+
+        Returns:
+            tuple|bool: A (provider, fields, event limit) tuple for each active provider or False
+                if auditing is disabled.
+        """
+        # stop if auditing is explicitly set to False
+        if audit_control.get('enabled') is False:
+            return False
+
+        plan = []
+        for provider in self.providers:
+            # each provider can have different settings
+            provider_control: dict = provider.resolve_audit_control(audit_control)
+            if not provider.is_active(provider_control):
+                continue
+
+            event_limit = None
+            if provider_control.get('max_event_bytes') is not None:
+                event_limit = (
+                    int(provider_control['max_event_bytes']),
+                    provider_control.get('truncate_marker'),
+                )
+            plan.append((provider, self.compile_fields(provider_control, provider), event_limit))
+        return tuple(plan)
+
+    def compile_fields(self, audit_control: dict, provider: object | None = None) -> tuple:
+        """Return compiled field getters for the provided audit control.
+
+        The getters are ordered req, resource, resp, timing so that a label defined for more
+        than one object resolves the same as it would using get_event_data().
+
+        Args:
+            audit_control: The resolved audit control for a provider.
+            provider: The provider with the truncation counters.
+
+        Returns:
+            tuple: A (label, source index, getter) tuple for each field.
+        """
+        fields = []
+        for i, key in enumerate(self.field_keys):
+            for label, field in (audit_control.get(key) or {}).items():
+                getter = self.compile_field(label, field, audit_control, provider)
+                if getter is not None:
+                    fields.append((label, i, getter))
+        return tuple(fields)
+
+    def compile_field(
+        self, label: str, field: str, audit_control: dict, provider: object | None = None
+    ) -> Callable[[object], object] | None:
+        """Return the compiled getter for a field.
+
+        Redaction rules and size limits are compiled into the getter of the field, a field
+        without a rule or limit uses the plain getter and has no overhead.
+
+        Args:
+            label: The field label.
+            field: The field name.
+            audit_control: The resolved audit control for a provider.
+            provider: The provider with the truncation counters.
+
+        Returns:
+            Callable|None: The getter or None if the field is dropped from the event.
+        """
+        getter = self.compile_getter(field)
+
+        redact: dict = audit_control.get('redact') or {}
+        if label in redact:
+            getter = AuditRedaction.compile(redact[label], getter)
+            if getter is None:
+                return None
+
+        max_bytes = (audit_control.get('truncate') or {}).get(
+            label, audit_control.get('max_field_bytes')
+        )
+        if max_bytes is not None and provider is not None:
+            getter = AuditLimits.compile(
+                max_bytes, getter, provider, audit_control.get('truncate_marker')
+            )
+        return getter
+
+    def reset(self) -> None:
+        """Clear all cached resource audit plans."""
+        self._resource_plans.clear()
+
+    @staticmethod
+    def compile_getter(field: str) -> Callable[[object], object]:
+        """Return a function that returns the field value from a falcon object.
+
+        Args:
+            field: The field name (e.g., "path", "headers.content-type", or "access_route.0").
+
+        Returns:
+            Callable: A function that accepts the falcon object and returns the value.
+        """
+        key1, key2 = AuditMiddleware.key_value(field)
 
-            # handle req data
-            req_data: dict = self.get_event_data(provider.req_fields, req)
-            event_data.update(req_data)
+        def get_attr(obj: object) -> object:
+            return getattr(obj, key1, None)
 
-            # handle resource data
-            resource_data: dict = self.get_event_data(provider.resource_fields, resource)
-            event_data.update(resource_data)
+        def get_context(obj: object) -> object:
+            return getattr(getattr(obj, 'context', None), key2, None)
 
-            # handle resp data
-            resp_data: dict = self.get_event_data(provider.resp_fields, resp)
-            event_data.update(resp_data)
+        def get_nested(obj: object) -> object:
+            data = getattr(obj, key1, None)
+            if isinstance(data, dict):
+                # handle nested dict (e.g., headers)
+                return data.get(key2)
+            if isinstance(data, list):
+                return AuditMiddleware.get_event_data_list(data, key2)
+            return data
 
-            # add event data
-            provider.add_event(event_data)
+        if key2 is None:
+            return get_attr
+        if key1 == 'context':
+            return get_context
+        return get_nested
 
     def get_event_data(self, field_dict: dict, obj: object) -> dict:
         """Get event data from provided object.
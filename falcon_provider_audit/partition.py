@@ -0,0 +1,264 @@
+"""Falcon audit partition module."""
+# standard library
+import logging
+import os
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+
+# first-party
+from falcon_provider_audit.utils import AuditProvider
+
+# get logger
+logger = logging.getLogger(__name__)
+
+
+class AuditPartition:
+    """A partition file with a write buffer.
+
+    Args:
+        filename: The full path of the partition file.
+        max_bytes: The maximum size of the file before rotating.
+        backup_count: The number of backup files to keep.
+    """
+
+    __slots__ = ('_file', 'backup_count', 'buffer', 'buffered', 'filename', 'max_bytes', 'size')
+
+    def __init__(self, filename: str, max_bytes: int, backup_count: int):
+        """Initialize class properties"""
+        self.backup_count = backup_count
+        self.buffer: list[bytes] = []
+        self.buffered = 0
+        self.filename = filename
+        self.max_bytes = max_bytes
+
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self._file = open(filename, 'ab')  # pylint: disable=consider-using-with
+        self.size = self._file.tell()
+
+    def append(self, line: bytes) -> None:
+        """Add a line to the write buffer."""
+        self.buffer.append(line)
+        self.buffered += len(line)
+
+    def close(self) -> None:
+        """Write the buffer and close the file."""
+        self.flush()
+        self._file.close()
+
+    def flush(self) -> None:
+        """Write the buffer to the file, rotating the file when it exceeds max_bytes."""
+        if not self.buffer:
+            return
+
+        if self.max_bytes and self.size and self.size + self.buffered > self.max_bytes:
+            self.rotate()
+
+        self._file.write(b''.join(self.buffer))
+        self._file.flush()
+        self.size += self.buffered
+        self.buffer.clear()
+        self.buffered = 0
+
+    def rotate(self) -> None:
+        """Rotate the file using the same naming as logging.handlers.RotatingFileHandler."""
+        self._file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f'{self.filename}.{i}'
+                if os.path.exists(source):
+                    os.replace(source, f'{self.filename}.{i + 1}')
+            os.replace(self.filename, f'{self.filename}.1')
+        self._file = open(self.filename, 'wb')  # pylint: disable=consider-using-with
+        self.size = 0
+
+
+class PartitionedFileAuditProvider(AuditProvider):
+    """Partitioned File Audit Provider.
+
+    Each event is written to a file chosen by formatting the path_template with the event data
+    (e.g., "{tenant}/{date}.log"). In addition to the event labels the template can use "date"
+    (YYYY-MM-DD) and "hour" (YYYY-MM-DDTHH) of the event time. Values are sanitized so that they
+    can only form a single path component and missing values are replaced with default_value.
+
+    Lines are buffered per partition and written when the buffer exceeds buffer_size, on each
+    interval, or when the partition is evicted. At most max_handles partition files are kept open,
+    when the limit is reached the least recently used partition is written and closed.
+
+    .. code:: python
+
+        provider = PartitionedFileAuditProvider(
+            audit_control=audit_control,
+            directory='log/audit',
+            path_template='{tenant}/{date}.log',
+        )
+
+    Args:
+        audit_control: A default audit control object.
+        backup_count: The number of backup files to keep for each partition.
+        buffer_size: The number of bytes buffered per partition before writing.
+        default_value: The value used for template fields missing from the event.
+        directory: The base directory of the partition files.
+        interval: The number of seconds between writes of the buffers. If None, flush() must be
+            called.
+        max_bytes: The maximum size of a partition file before rotating.
+        max_handles: The maximum number of open partition files.
+        path_template: The partition file path template.
+    """
+
+    unsafe_chars = re.compile(r'[^\w.@+-]')
+
+    def __init__(
+        self,
+        audit_control: dict | None = None,
+        backup_count: int | None = 10,
+        buffer_size: int | None = 65_536,
+        default_value: str | None = 'unknown',
+        directory: str | None = 'log',
+        interval: float | None = 1,
+        max_bytes: int | None = 10_485_760,
+        max_handles: int | None = 64,
+        path_template: str | None = '{date}.log',
+    ):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        self.backup_count = backup_count
+        self.buffer_size = buffer_size
+        self.default_value = default_value
+        self.directory = directory
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.max_handles = max_handles
+        self.path_template = path_template
+
+        # property
+        self._name = 'partitioned_file'
+
+        # the template field names are parsed once
+        self.template_fields = tuple(
+            {name for _, name, _, _ in string.Formatter().parse(path_template) if name}
+        )
+
+        # the open partitions by filename, ordered from least to most recently used
+        self._partitions: OrderedDict[str, AuditPartition] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if interval:
+            self._thread = threading.Thread(
+                name='audit_partition', target=self._flush_interval, daemon=True
+            )
+            self._thread.start()
+
+    def _flush_interval(self) -> None:
+        """Write the partition buffers on each interval until closed."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to flush partitioned audit events.')
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event.
+
+        Args:
+            event: The event data.
+        """
+        now = time.time()
+        filename = self.partition_filename(event, now)
+        line = self.format_event(event, now).encode()
+
+        with self._lock:
+            partition = self._partitions.get(filename)
+            if partition is None:
+                partition = self._open(filename)
+            else:
+                self._partitions.move_to_end(filename)
+
+            partition.append(line)
+            if partition.buffered >= self.buffer_size:
+                partition.flush()
+
+    def close(self) -> None:
+        """Stop the flush thread, write all buffers, and close all partition files."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            while self._partitions:
+                self._partitions.popitem(last=False)[1].close()
+
+    def flush(self) -> None:
+        """Write the buffers of all open partitions."""
+        with self._lock:
+            for partition in self._partitions.values():
+                partition.flush()
+
+    @staticmethod
+    def format_event(event: dict, now: float) -> str:
+        """Return the event as a log line.
+
+        Args:
+            event: The event data.
+            now: The event time.
+
+        Returns:
+            str: The formatted log line.
+        """
+        event_data = []
+        for k, v in sorted(event.items()):
+            if isinstance(v, list):
+                v = ','.join(v)
+            event_data.append(f'{k}="{v}"')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        return f'{timestamp} - {", ".join(event_data)}\n'
+
+    def _open(self, filename: str) -> AuditPartition:
+        """Open the partition, closing the least recently used partition if required."""
+        if len(self._partitions) >= self.max_handles:
+            self._partitions.popitem(last=False)[1].close()
+        partition = AuditPartition(filename, self.max_bytes, self.backup_count)
+        self._partitions[filename] = partition
+        return partition
+
+    @property
+    def partitions(self) -> list[str]:
+        """Return the filenames of the open partitions."""
+        return list(self._partitions)
+
+    def partition_filename(self, event: dict, now: float) -> str:
+        """Return the partition filename for the event.
+
+        Args:
+            event: The event data.
+            now: The event time.
+
+        Returns:
+            str: The full path of the partition file.
+        """
+        values = {}
+        for name in self.template_fields:
+            if name == 'date':
+                value = time.strftime('%Y-%m-%d', time.localtime(now))
+            elif name == 'hour':
+                value = time.strftime('%Y-%m-%dT%H', time.localtime(now))
+            else:
+                value = event.get(name)
+            values[name] = self.sanitize(value)
+        return os.path.join(self.directory, self.path_template.format_map(values))
+
+    def sanitize(self, value: object) -> str:
+        """Return the value as a safe single path component.
+
+        Args:
+            value: The template field value.
+
+        Returns:
+            str: The sanitized value.
+        """
+        if value is None or value == '':
+            return self.default_value
+        value = self.unsafe_chars.sub('_', str(value)).lstrip('.')
+        return value or self.default_value
@@ -0,0 +1,138 @@
+"""Falcon audit redaction module."""
+# standard library
+import hmac
+import re
+from collections.abc import Callable
+
+
+class AuditRedaction:
+    """Compile redaction rules into audit field transformers.
+
+    **Redaction Rules**
+
+    The rules are defined in the "redact" audit control key using the field label as the key.
+    A rule can be a dict or the action name as a string (e.g., 'drop').
+
+    drop: The field is removed from the audit event.
+    mask: The value is replaced with the mask char, optionally keeping the last "keep" chars.
+    hmac: The value is replaced with a keyed HMAC hex digest ("key" and optional "digestmod").
+    replace: The regex "pattern" is replaced with "repl" in the value.
+    allowlist: Only the query string parameters in "params" are kept. If "replacement" is
+        provided the value of all other parameters is replaced, else the parameter is removed.
+
+    .. code:: python
+
+        audit_control = {
+            'redact': {
+                'request_query_string': {'action': 'allowlist', 'params': ['page', 'sort']},
+                'request_remote_addr': {'action': 'hmac', 'key': 'secret'},
+                'request_user_agent': 'drop',
+                'user_id': {'action': 'mask', 'keep': 4},
+                'request_path': {'action': 'replace', 'pattern': r'/\\d+', 'repl': '/{id}'},
+            }
+        }
+    """
+
+    @classmethod
+    def compile(cls, rule: dict | str, getter: Callable) -> Callable | None:
+        """Return a getter that applies the redaction rule to the value.
+
+        Args:
+            rule: The redaction rule.
+            getter: The getter function for the field.
+
+        Returns:
+            Callable|None: The redacting getter or None if the field should be dropped.
+
+        Raises:
+            ValueError: The redaction rule is invalid.
+        """
+        if isinstance(rule, str):
+            rule = {'action': rule}
+
+        action = rule.get('action')
+        if action == 'drop':
+            return None
+
+        transformers = {
+            'allowlist': cls.allowlist,
+            'hmac': cls.hmac,
+            'mask': cls.mask,
+            'replace': cls.replace,
+        }
+        if action not in transformers:
+            raise ValueError(f'Invalid redaction action "{action}".')
+
+        try:
+            transform: Callable[[str], str] = transformers[action](rule)
+        except (KeyError, TypeError, re.error) as ex:
+            raise ValueError(f'Invalid redaction rule {rule}: {ex}') from ex
+
+        def redact(obj: object) -> object:
+            value = getter(obj)
+            if value is None:
+                return None
+            if isinstance(value, list):
+                return [transform(str(v)) for v in value]
+            return transform(str(value))
+
+        return redact
+
+    @staticmethod
+    def allowlist(rule: dict) -> Callable[[str], str]:
+        """Return a transformer that only keeps the allowed query string parameters."""
+        params = frozenset(rule['params'])
+        replacement: str | None = rule.get('replacement')
+
+        def transform(value: str) -> str:
+            kept = []
+            for param in value.split('&'):
+                name = param.split('=', 1)[0]
+                if name in params:
+                    kept.append(param)
+                elif replacement is not None:
+                    kept.append(f'{name}={replacement}')
+            return '&'.join(kept)
+
+        return transform
+
+    @staticmethod
+    def hmac(rule: dict) -> Callable[[str], str]:
+        """Return a transformer that replaces the value with a keyed HMAC hex digest."""
+        key: bytes | str = rule['key']
+        if isinstance(key, str):
+            key = key.encode()
+
+        # the keyed HMAC is created once and copied for each value
+        keyed = hmac.new(key, digestmod=rule.get('digestmod', 'sha256'))
+
+        def transform(value: str) -> str:
+            digest = keyed.copy()
+            digest.update(value.encode())
+            return digest.hexdigest()
+
+        return transform
+
+    @staticmethod
+    def mask(rule: dict) -> Callable[[str], str]:
+        """Return a transformer that masks the value."""
+        char: str = rule.get('char', '*')
+        keep = int(rule.get('keep', 0))
+
+        def transform(value: str) -> str:
+            if keep <= 0:
+                return char * len(value)
+            return char * max(len(value) - keep, 0) + value[-keep:]
+
+        return transform
+
+    @staticmethod
+    def replace(rule: dict) -> Callable[[str], str]:
+        """Return a transformer that replaces the regex pattern in the value."""
+        pattern = re.compile(rule['pattern'])
+        repl: str = rule.get('repl', '***')
+
+        def transform(value: str) -> str:
+            return pattern.sub(repl, value)
+
+        return transform
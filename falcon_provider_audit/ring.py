@@ -0,0 +1,156 @@
+"""Falcon audit ring buffer module."""
+# standard library
+import itertools
+import json
+import time
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.utils import AuditProvider
+
+
+class RingBufferAuditProvider(AuditProvider):
+    """Ring Buffer Audit Provider.
+
+    The most recent events are kept in a fixed number of preallocated slots, once all slots are
+    used the oldest event is overwritten. Each slot holds the sequence number, the event time,
+    and the event values. The event labels are stored once per distinct set of labels and shared
+    by all slots.
+
+    Adding an event does not lock or allocate beyond the slot tuple, so the provider is safe to
+    use from multiple threads and never grows beyond the configured size.
+
+    Args:
+        audit_control: A default audit control object.
+        size: The number of events to keep.
+        max_label_sets: The maximum number of distinct sets of event labels to share.
+    """
+
+    def __init__(
+        self,
+        audit_control: dict | None = None,
+        size: int | None = 1_000,
+        max_label_sets: int | None = 1_024,
+    ):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        if size < 1:
+            raise ValueError('The ring buffer size must be at least 1.')
+        self.max_label_sets = max_label_sets
+        self.size = size
+
+        # property
+        self._name = 'ring_buffer'
+
+        self._counter = itertools.count()
+        self._labels: dict[tuple, tuple] = {}
+        self._slots: list[tuple | None] = [None] * size
+
+    def __len__(self) -> int:
+        """Return the number of events in the buffer."""
+        return sum(1 for slot in self._slots if slot is not None)
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event.
+
+        Args:
+            event: The event data.
+        """
+        labels = tuple(event)
+        shared = self._labels.get(labels)
+        if shared is None:
+            shared = labels
+            if len(self._labels) < self.max_label_sets:
+                self._labels[labels] = labels
+
+        # next() on itertools.count is atomic, so each event gets a unique slot
+        seq = next(self._counter)
+        self._slots[seq % self.size] = (seq, time.time(), shared, tuple(event.values()))
+
+    def clear(self) -> None:
+        """Remove all events from the buffer."""
+        self._slots = [None] * self.size
+
+    def events(self, limit: int | None = None, **filters) -> list[dict]:
+        """Return the buffered events from newest to oldest.
+
+        Args:
+            limit: The maximum number of events to return.
+            filters: The event label and value that each returned event must match. A value
+                also matches the leading token of the event value (e.g., "404" matches a
+                response_status of "404 Not Found").
+
+        Returns:
+            list: The matching events with the "audit_seq" and "audit_time" of each event.
+        """
+        slots = sorted((slot for slot in self._slots if slot is not None), reverse=True)
+        events = []
+        for seq, event_time, labels, values in slots:
+            event = dict(zip(labels, values))
+            if not all(self.matches(event.get(k), v) for k, v in filters.items()):
+                continue
+
+            event['audit_seq'] = seq
+            event['audit_time'] = event_time
+            events.append(event)
+            if limit is not None and len(events) >= limit:
+                break
+        return events
+
+    @staticmethod
+    def matches(value: object, expected: str) -> bool:
+        """Return True if the event value matches the expected value."""
+        if value is None:
+            return False
+        value = str(value)
+        return value == expected or value.split(' ', 1)[0] == expected
+
+
+class RingBufferResource:
+    """Falcon resource that serves the recent events of a ring buffer provider as JSON.
+
+    The events can be filtered with query parameters mapped to event labels by the filters
+    argument and limited with the "limit" query parameter. Requests to this resource are not
+    audited.
+
+    .. code:: python
+
+        app.add_route('/audit/recent', RingBufferResource(ring_buffer_provider))
+
+    Args:
+        provider: The ring buffer provider.
+        filters: The query parameter names and the event label to filter.
+        max_limit: The maximum number of events returned.
+    """
+
+    audit_control = {'enabled': False}
+
+    def __init__(
+        self,
+        provider: RingBufferAuditProvider,
+        filters: dict | None = None,
+        max_limit: int | None = 1_000,
+    ):
+        """Initialize class properties"""
+        self.provider = provider
+        self.filters = filters or {
+            'path': 'request_path',
+            'status': 'response_status',
+            'user': 'user_id',
+        }
+        self.max_limit = max_limit
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        limit = req.get_param_as_int('limit', min_value=1, max_value=self.max_limit)
+        filters = {}
+        for param, label in self.filters.items():
+            value = req.get_param(param)
+            if value is not None:
+                filters[label] = value
+
+        events = self.provider.events(limit=limit or self.max_limit, **filters)
+        resp.content_type = falcon.MEDIA_JSON
+        resp.text = json.dumps({'events': events}, default=str)
@@ -0,0 +1,236 @@
+"""Falcon audit HTTP shipper module."""
+# standard library
+import gzip
+import http.client
+import json
+import logging
+import queue
+import ssl
+import threading
+import time
+from urllib.parse import urlsplit
+
+# first-party
+from falcon_provider_audit.utils import AuditProvider
+
+# get logger
+logger = logging.getLogger(__name__)
+
+
+class HttpBatchAuditProvider(AuditProvider):
+    """HTTP Batch Audit Provider.
+
+    Events are serialized as JSON lines and sent to the collector url in gzip compressed NDJSON
+    batches. A batch is sent when it reaches batch_size events, on each interval, and on close.
+
+    The batches are sent by pool_size sender threads, each with a persistent (keep-alive)
+    connection to the collector, so adding an event never blocks on the network. A failed batch
+    (connection error, 429, or 5xx response) is retried with exponential backoff, other responses
+    are not retried. When all retries fail or more than max_batches are waiting the batch is
+    dropped and counted in dropped_events.
+
+    .. code:: python
+
+        provider = HttpBatchAuditProvider(
+            audit_control=audit_control,
+            url='https://collector.example.com/v1/audit',
+            headers={'Authorization': 'Bearer <token>'},
+        )
+
+    Args:
+        audit_control: A default audit control object.
+        url: The collector url (http or https).
+        batch_size: The maximum number of events in a batch.
+        compress_level: The gzip compression level.
+        headers: Additional headers sent with each batch (e.g., Authorization).
+        interval: The number of seconds between sends of a partial batch. If None, flush() must
+            be called.
+        max_batches: The maximum number of batches waiting to be sent.
+        pool_size: The number of sender threads and persistent connections.
+        retries: The number of retries of a failed batch.
+        backoff: The seconds to wait before the first retry, doubled on each retry.
+        ssl_context: The SSL context for https urls.
+        timeout: The connection timeout in seconds.
+    """
+
+    retry_status = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        audit_control: dict | None = None,
+        url: str | None = 'http://localhost:8080/',
+        batch_size: int | None = 500,
+        compress_level: int | None = 6,
+        headers: dict | None = None,
+        interval: float | None = 5,
+        max_batches: int | None = 100,
+        pool_size: int | None = 2,
+        retries: int | None = 3,
+        backoff: float | None = 0.5,
+        ssl_context: ssl.SSLContext | None = None,
+        timeout: float | None = 10,
+    ):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        self.batch_size = batch_size
+        self.compress_level = compress_level
+        self.interval = interval
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff = backoff
+        self.ssl_context = ssl_context
+        self.timeout = timeout
+        self.url = urlsplit(url)
+        if self.url.scheme not in ('http', 'https'):
+            raise ValueError(f'Invalid collector url "{url}".')
+
+        # property
+        self._name = 'http_batch'
+
+        self.headers = {
+            'Content-Encoding': 'gzip',
+            'Content-Type': 'application/x-ndjson',
+            **(headers or {}),
+        }
+        self.path = self.url.path or '/'
+        if self.url.query:
+            self.path = f'{self.path}?{self.url.query}'
+
+        # counters
+        self.dropped_events = 0
+        self.sent_events = 0
+
+        self._batch: list[bytes] = []
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_batches)
+        self._senders = [
+            threading.Thread(name=f'audit_http_{i}', target=self._send_batches, daemon=True)
+            for i in range(pool_size)
+        ]
+        for sender in self._senders:
+            sender.start()
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        if interval:
+            self._thread = threading.Thread(
+                name='audit_http', target=self._flush_interval, daemon=True
+            )
+            self._thread.start()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """Return a new connection to the collector."""
+        if self.url.scheme == 'https':
+            return http.client.HTTPSConnection(
+                self.url.hostname, self.url.port, timeout=self.timeout, context=self.ssl_context
+            )
+        return http.client.HTTPConnection(self.url.hostname, self.url.port, timeout=self.timeout)
+
+    def _flush_interval(self) -> None:
+        """Queue the partial batch on each interval until closed."""
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def _send_batches(self) -> None:
+        """Send the queued batches using a persistent connection until closed."""
+        connection = self._connect()
+        while True:
+            batch = self._queue.get()
+            try:
+                if batch is None:
+                    break
+                if self.send(connection, batch):
+                    with self._lock:
+                        self.sent_events += len(batch)
+                else:
+                    self._drop(batch)
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to send audit events.')
+                self._drop(batch)
+            finally:
+                self._queue.task_done()
+        connection.close()
+
+    def _drop(self, batch: list[bytes]) -> None:
+        """Count the events of a dropped batch."""
+        with self._lock:
+            self.dropped_events += len(batch)
+
+    def _queue_batch(self) -> None:
+        """Queue the current batch for the senders (the lock must be held)."""
+        batch, self._batch = self._batch, []
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped_events += len(batch)
+            logger.warning(f'Audit batch queue is full, dropped {len(batch)} events.')
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event.
+
+        Args:
+            event: The event data.
+        """
+        line = json.dumps(event, default=str, separators=(',', ':')).encode() + b'\n'
+        with self._lock:
+            self._batch.append(line)
+            if len(self._batch) >= self.batch_size:
+                self._queue_batch()
+
+    def close(self) -> None:
+        """Send all events and stop the sender threads."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        for _ in self._senders:
+            self._queue.put(None)
+        for sender in self._senders:
+            sender.join()
+
+    def flush(self, wait: bool | None = False) -> None:
+        """Queue the partial batch for the senders.
+
+        Args:
+            wait: If True, wait until all queued batches are sent or dropped.
+        """
+        with self._lock:
+            if self._batch:
+                self._queue_batch()
+        if wait:
+            self._queue.join()
+
+    def send(self, connection: http.client.HTTPConnection, batch: list[bytes]) -> bool:
+        """Send the batch to the collector, retrying with backoff.
+
+        Args:
+            connection: The persistent connection of the sender.
+            batch: The JSON lines of the events.
+
+        Returns:
+            bool: True if the collector accepted the batch.
+        """
+        body = gzip.compress(b''.join(batch), compresslevel=self.compress_level)
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+
+            try:
+                connection.request('POST', self.path, body=body, headers=self.headers)
+                response = connection.getresponse()
+                # the response must be read before the connection can be reused
+                response.read()
+            except (OSError, http.client.HTTPException) as ex:
+                # the connection reconnects on the next request
+                connection.close()
+                logger.warning(f'Failed to send audit events to collector: {ex}')
+                continue
+
+            if response.will_close:
+                connection.close()
+            if 200 <= response.status < 300:
+                return True
+            logger.warning(f'Audit collector returned {response.status} {response.reason}.')
+            if response.status not in self.retry_status:
+                return False
+        return False
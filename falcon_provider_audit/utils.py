@@ -1,8 +1,11 @@
 """Audit middleware module."""
 # standard library
+import hashlib
 import logging
 import os
 import socket
+import time
+from collections.abc import Callable
 from logging.handlers import RotatingFileHandler
 
 
@@ -33,6 +36,194 @@ class RotatingFileHandlerCustom(RotatingFileHandler):
         RotatingFileHandler.__init__(self, filename, mode, maxBytes, backupCount, encoding, delay)
 
 
+class AuditStream:
+    """Pass-through response stream that counts (and optionally hashes) the bytes sent.
+
+    The chunks are passed through unchanged and are never buffered.
+
+    Args:
+        stream: The response stream (an iterable of bytes).
+        callback: A function called with this instance once the stream is closed.
+        hash_name: The hashlib algorithm name (e.g., sha256) used to hash the bytes sent.
+    """
+
+    __slots__ = ('_callback', '_hash', 'bytes_sent', 'stream')
+
+    def __init__(self, stream: object, callback: Callable, hash_name: str | None = None):
+        """Initialize class properties"""
+        self.stream = stream
+        self.bytes_sent = 0
+        self._callback = callback
+        self._hash = hashlib.new(hash_name) if hash_name else None
+
+    def __iter__(self):
+        """Yield the chunks of the wrapped stream."""
+        for chunk in self.stream:
+            self.update(chunk)
+            yield chunk
+
+    @classmethod
+    def wrap(cls, stream: object, callback: Callable, hash_name: str | None = None) -> object:
+        """Return the wrapped stream, preserving a file-like interface.
+
+        Args:
+            stream: The response stream (a file-like object or an iterable of bytes).
+            callback: A function called with the wrapped stream once the stream is closed.
+            hash_name: The hashlib algorithm name (e.g., sha256) used to hash the bytes sent.
+
+        Returns:
+            AuditStream: The wrapped stream.
+        """
+        if hasattr(stream, 'read'):
+            return AuditStreamReader(stream, callback, hash_name)
+        return cls(stream, callback, hash_name)
+
+    def close(self) -> None:
+        """Close the wrapped stream and run the callback a single time."""
+        callback, self._callback = self._callback, None
+        try:
+            if hasattr(self.stream, 'close'):
+                self.stream.close()
+        finally:
+            if callback is not None:
+                callback(self)
+
+    @property
+    def hexdigest(self) -> str | None:
+        """Return the hex digest of the bytes sent."""
+        if self._hash is None:
+            return None
+        return self._hash.hexdigest()
+
+    def update(self, chunk: bytes) -> None:
+        """Update the byte count and hash with the chunk."""
+        self.bytes_sent += len(chunk)
+        if self._hash is not None:
+            self._hash.update(chunk)
+
+
+class AuditStreamReader(AuditStream):
+    """Pass-through file-like response stream that counts (and optionally hashes) the bytes sent.
+
+    The fileno() method is intentionally not provided so that the WSGI server reads the data
+    through this wrapper instead of sending the file directly (e.g., os.sendfile).
+    """
+
+    __slots__ = ()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read from the wrapped stream.
+
+        Args:
+            size: The maximum number of bytes to read.
+
+        Returns:
+            bytes: The data read from the stream.
+        """
+        chunk: bytes = self.stream.read(size)
+        self.update(chunk)
+        return chunk
+
+
+class AuditRequestStream:
+    """Pass-through request stream that counts and hashes the bytes read by the responder.
+
+    The data is hashed incrementally as the responder consumes the stream and is never buffered.
+    Once more than max_bytes have been read the hash is discarded, so the hexdigest is only
+    available for a body that has been completely hashed.
+
+    Args:
+        stream: The request stream (e.g., wsgi.input).
+        hash_name: The hashlib algorithm name (e.g., sha256).
+        max_bytes: The maximum number of bytes to hash.
+    """
+
+    __slots__ = ('_hash', 'bytes_read', 'max_bytes', 'stream')
+
+    def __init__(self, stream: object, hash_name: str, max_bytes: int | None = None):
+        """Initialize class properties"""
+        self.stream = stream
+        self.bytes_read = 0
+        self.max_bytes = max_bytes
+        self._hash = hashlib.new(hash_name)
+
+    def __iter__(self):
+        """Yield the lines of the wrapped stream."""
+        for line in self.stream:
+            self.update(line)
+            yield line
+
+    @property
+    def hexdigest(self) -> str | None:
+        """Return the hex digest of the bytes read or None if max_bytes was exceeded."""
+        if self._hash is None:
+            return None
+        return self._hash.hexdigest()
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read from the wrapped stream."""
+        return self.update(self.stream.read(size))
+
+    def readline(self, limit: int | None = -1) -> bytes:
+        """Read a line from the wrapped stream."""
+        return self.update(self.stream.readline(limit))
+
+    def readlines(self, hint: int | None = -1) -> list[bytes]:
+        """Read lines from the wrapped stream."""
+        lines: list[bytes] = self.stream.readlines(hint)
+        for line in lines:
+            self.update(line)
+        return lines
+
+    def update(self, chunk: bytes) -> bytes:
+        """Update the byte count and hash with the chunk."""
+        self.bytes_read += len(chunk)
+        if self._hash is not None:
+            if self.max_bytes is not None and self.bytes_read > self.max_bytes:
+                # stop hashing, a partial digest would not represent the body
+                self._hash = None
+            else:
+                self._hash.update(chunk)
+        return chunk
+
+
+class AuditTimer:
+    """Request timing captured with a monotonic clock.
+
+    Args:
+        start_ns: The perf_counter_ns() value at the start of the request.
+    """
+
+    __slots__ = ('end_ns', 'resource_ns', 'start_ns')
+
+    def __init__(self, start_ns: int):
+        """Initialize class properties"""
+        self.start_ns = start_ns
+        self.resource_ns: int | None = None
+        self.end_ns: int | None = None
+
+    @property
+    def duration_ms(self) -> float | None:
+        """Return the milliseconds from the start of the request to the response."""
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    @property
+    def resource_time(self) -> float | None:
+        """Return the milliseconds from the start of the request to resource routing."""
+        if self.resource_ns is None:
+            return None
+        return (self.resource_ns - self.start_ns) / 1_000_000
+
+    @property
+    def start_time(self) -> float:
+        """Return the start of the request as seconds since the epoch."""
+        # derive the wall clock time from the monotonic clock so that only a single clock
+        # read is required at the start of every request
+        return time.time() - (time.perf_counter_ns() - self.start_ns) / 1_000_000_000
+
+
 class AuditProvider:
     """Base Audit Provider Class.
 
@@ -40,6 +231,24 @@ class AuditProvider:
         audit_control: A default audit control object.
     """
 
+    # the audit control keys supported by the provider, child classes may extend
+    audit_control_keys = frozenset(
+        [
+            'enabled',
+            'max_event_bytes',
+            'max_field_bytes',
+            'provider_names',
+            'providers',
+            'redact',
+            'req_fields',
+            'resource_fields',
+            'resp_fields',
+            'timing_fields',
+            'truncate',
+            'truncate_marker',
+        ]
+    )
+
     def __init__(self, audit_control: dict | None = None):
         """Initialize class properties
 
@@ -55,8 +264,16 @@ class AuditProvider:
         resp_fields (dict): A dict of label and field names from the resp object that should be
             added to the audit event. A None value or empty dict indicates that no value from this
             object should be added to audit event.
+        timing_fields (dict): A dict of label and timing names (duration_ms, resource_time, or
+            start_time) that should be added to the audit event.
         provider_names (list): A list of audit providers that the audit event should be written. If
             a None value is provided the event will be sent to all audit providers.
+        redact (dict): A dict of label and redaction rule (drop, mask, hmac, replace, or
+            allowlist) applied to the field value (see AuditRedaction).
+        max_field_bytes (int): The maximum size of any string value in the audit event. The
+            truncate dict of label and size overrides the value per field (see AuditLimits).
+        max_event_bytes (int): The maximum size of the labels and string values in the audit
+            event (see AuditLimits).
 
         .. code:: python
 
@@ -66,6 +283,7 @@ class AuditProvider:
                     'req_fields': {},
                     'resource_fields': {},
                     'resp_fields': {},
+                    'timing_fields': {},
                     'provider_names': None,
                 }
                 def on_get(self, req, resp):
@@ -76,6 +294,8 @@ class AuditProvider:
             'resource_fields': [],
             'req_fields': [],
             'resp_fields': [],
+            'timing_fields': [],
+            'provider_names': None,
             'providers': None,
         }
         if audit_control is not None:
@@ -86,6 +306,10 @@ class AuditProvider:
         # property
         self._name = None
 
+        # counters for values and events truncated by size limits
+        self.truncated_events = 0
+        self.truncated_fields = 0
+
     def add_event(self, event: dict) -> None:  # pragma: no cover
         """Add audit event"""
         raise NotImplementedError('This method must be implemented in child class.')
@@ -99,15 +323,46 @@ class AuditProvider:
         Returns:
             dict: Updated audit control settings.
         """
+        self._audit_control = self.resolve_audit_control(audit_control)
+        return self._audit_control
+
+    def is_active(self, audit_control: dict) -> bool:
+        """Return True if events should be written to this provider.
+
+        Args:
+            audit_control: The resolved audit control settings (see resolve_audit_control).
+
+        Returns:
+            bool: True if the provider is enabled and selected by provider_names.
+        """
+        if audit_control.get('enabled', False) is False:
+            return False
+
+        provider_names = audit_control.get('provider_names')
+        if provider_names is None:
+            # support the legacy "providers" key
+            provider_names = audit_control.get('providers')
+        return provider_names is None or self.name in provider_names
+
+    def resolve_audit_control(self, audit_control: dict | None = None) -> dict:
+        """Return the global audit control updated with the resource audit control.
+
+        Unlike audit_control(), the provider state is not updated, which allows the middleware
+        to resolve the settings once per resource instead of once per request.
+
+        Args:
+            audit_control: The resource audit control settings.
+
+        Returns:
+            dict: The resolved audit control settings.
+        """
         audit_control = audit_control or {}
-        self._audit_control = dict(self._global_audit_control)
 
         # handle updates per provider name
         if audit_control.get(self.name) is not None:
             audit_control: dict = audit_control.get(self.name)
 
-        self._audit_control.update(audit_control)
-        return self._audit_control
+        return {**self._global_audit_control, **audit_control}
 
     @property
     def enabled(self) -> bool:
@@ -121,8 +376,11 @@ class AuditProvider:
 
     @property
     def providers(self) -> list:
-        """Return audit control providers value."""
-        return self._audit_control.get('providers')
+        """Return audit control provider_names (or legacy providers) value."""
+        provider_names = self._audit_control.get('provider_names')
+        if provider_names is None:
+            provider_names = self._audit_control.get('providers')
+        return provider_names
 
     @property
     def req_fields(self) -> dict:
@@ -139,6 +397,11 @@ class AuditProvider:
         """Return audit control resp_fields value."""
         return self._audit_control.get('resp_fields') or {}
 
+    @property
+    def timing_fields(self) -> dict:
+        """Return audit control timing_fields value."""
+        return self._audit_control.get('timing_fields') or {}
+
 
 class RotatingLoggerAuditProvider(AuditProvider):
     """Logger Audit Provider.
@@ -218,16 +481,13 @@ class RotatingLoggerAuditProvider(AuditProvider):
             level (kwargs): The logging level.
         """
         level: str = kwargs.get('level', 'info').lower()
-        if self.providers is None or (
-            isinstance(self.providers, list) and self.name in self.providers
-        ):
-            log = getattr(self.log, level)
-            event_data = []
-            for k, v in sorted(event.items()):
-                if isinstance(v, list):
-                    v = ','.join(v)
-                event_data.append(f'{k}="{v}"')
-            log(', '.join(event_data))
+        log = getattr(self.log, level)
+        event_data = []
+        for k, v in sorted(event.items()):
+            if isinstance(v, list):
+                v = ','.join(v)
+            event_data.append(f'{k}="{v}"')
+        log(', '.join(event_data))
 
 
 class SyslogAuditProvider(AuditProvider):
@@ -304,13 +564,10 @@ class SyslogAuditProvider(AuditProvider):
             level (kwargs): The logging level.
         """
         level: str = kwargs.get('level', 'info').lower()
-        if self.providers is None or (
-            isinstance(self.providers, list) and self.name in self.providers
-        ):
-            log = getattr(self.log, level)
-            event_data = []
-            for k, v in sorted(event.items()):
-                if isinstance(v, list):
-                    v = ','.join(v)
-                event_data.append(f'{k}="{v}"')
-            log(', '.join(event_data))
+        log = getattr(self.log, level)
+        event_data = []
+        for k, v in sorted(event.items()):
+            if isinstance(v, list):
+                v = ','.join(v)
+            event_data.append(f'{k}="{v}"')
+        log(', '.join(event_data))
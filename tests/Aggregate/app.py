@@ -0,0 +1,61 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit import AuditProvider
+from falcon_provider_audit.aggregate import AggregatingAuditProvider
+from falcon_provider_audit.middleware import AuditMiddleware
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {'request_method': 'method', 'request_path': 'path'},
+    'resp_fields': {'response_status': 'status'},
+    'timing_fields': {'request_duration_ms': 'duration_ms'},
+}
+
+
+class ListAuditProvider(AuditProvider):
+    """In-memory Audit Provider used for testing."""
+
+    def __init__(self, audit_control: dict | None = None):
+        """Initialize class properties"""
+        super().__init__(audit_control)
+        self.events = []
+
+        # property
+        self._name = 'list'
+
+    def add_event(self, event: dict, **kwargs) -> None:
+        """Add an audit event.
+
+        Args:
+            event: The event data.
+        """
+        self.events.append(event)
+
+
+class AggregateResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'Audited'
+
+    def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support POST method."""
+        resp.status = falcon.HTTP_201
+
+
+summary_provider = ListAuditProvider()
+aggregate_provider = AggregatingAuditProvider(
+    audit_control=audit_control,
+    provider=summary_provider,
+    key_fields=['request_method', 'request_path', 'response_status'],
+    value_field='request_duration_ms',
+    buckets=[1_000, 60_000],
+    interval=None,
+)
+
+app_aggregate_1 = falcon.App(middleware=[AuditMiddleware(providers=[aggregate_provider])])
+app_aggregate_1.add_route('/middleware', AggregateResource1())
@@ -0,0 +1,120 @@
+"""Test aggregate feature of falcon_provider_audit module."""
+# standard library
+import multiprocessing
+import os
+import time
+from uuid import uuid4
+
+# first-party
+from falcon_provider_audit.aggregate import AggregatingAuditProvider
+
+from .app import ListAuditProvider, aggregate_provider, summary_provider
+
+
+def test_aggregate(client_aggregate_1: object) -> None:
+    """Testing aggregated audit events.
+
+    Args:
+        client_aggregate_1 (fixture): The test client.
+    """
+    aggregate_provider.flush()
+    summary_provider.events.clear()
+
+    for _ in range(5):
+        assert client_aggregate_1.simulate_get('/middleware').status_code == 200
+    for _ in range(2):
+        assert client_aggregate_1.simulate_post('/middleware').status_code == 201
+
+    assert aggregate_provider.flush() == 2
+    events = {e['request_method']: e for e in summary_provider.events}
+    assert events['GET']['count'] == 5
+    assert events['GET']['request_path'] == '/middleware'
+    assert events['GET']['response_status'] == '200 OK'
+    assert events['GET']['request_duration_ms_le_1000'] == 5
+    assert events['GET']['request_duration_ms_le_inf'] == 0
+    assert 0 < events['GET']['request_duration_ms_min'] <= events['GET']['request_duration_ms_max']
+    assert events['POST']['count'] == 2
+    assert events['POST']['response_status'] == '201 Created'
+    assert events['POST']['window_start'] <= events['POST']['window_end'] <= time.time()
+
+    # nothing to flush
+    assert aggregate_provider.flush() == 0
+
+
+def test_aggregate_max_keys() -> None:
+    """Testing aggregated audit events with more groups than max keys."""
+    provider = ListAuditProvider()
+    aggregate = AggregatingAuditProvider(
+        provider=provider, key_fields=['user_id'], value_field='size', buckets=[10], max_keys=2
+    )
+    for i in range(5):
+        aggregate.add_event({'user_id': i, 'size': i * 5})
+    aggregate.close()
+
+    events = {e['user_id']: e for e in provider.events}
+    assert sorted(events, key=str) == [0, 1, '__other__']
+    assert events['__other__']['count'] == 3
+    assert events['__other__']['size_sum'] == 45
+    assert events['__other__']['size_min'] == 10
+    assert events['__other__']['size_max'] == 20
+    assert events['__other__']['size_le_10'] == 1
+    assert events['__other__']['size_le_inf'] == 2
+
+
+def test_aggregate_shared_memory() -> None:
+    """Testing aggregated audit events in shared memory across forked processes."""
+    name = f'audit-{uuid4().hex[:12]}'
+    provider = ListAuditProvider()
+    aggregate = AggregatingAuditProvider(
+        provider=provider,
+        key_fields=['request_path', 'user_id'],
+        value_field='size',
+        buckets=[10],
+        interval=None,
+        max_keys=8,
+        shared_memory_name=name,
+    )
+    # elect the parent process as the flusher
+    assert aggregate.flush() == 0
+
+    def worker(worker_id: int) -> None:
+        """Add events from a worker process attached to the segment by name."""
+        worker_provider = ListAuditProvider()
+        worker_aggregate = AggregatingAuditProvider(
+            provider=worker_provider,
+            key_fields=['request_path', 'user_id'],
+            value_field='size',
+            buckets=[10],
+            interval=None,
+            max_keys=8,
+            shared_memory_name=name,
+        )
+        for i in range(100):
+            worker_aggregate.add_event(
+                {'request_path': '/middleware', 'user_id': i % 2, 'size': worker_id * 10}
+            )
+        # the parent process is the elected flusher
+        os._exit(0 if worker_aggregate.flush() == 0 and not worker_provider.events else 1)
+
+    context = multiprocessing.get_context('fork')
+    processes = [context.Process(target=worker, args=(i,)) for i in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    assert [process.exitcode for process in processes] == [0, 0, 0, 0]
+
+    try:
+        assert aggregate.flush() == 2
+        events = {e['user_id']: e for e in provider.events}
+        assert events[0]['count'] == events[1]['count'] == 200
+        assert events[0]['request_path'] == '/middleware'
+        assert events[0]['size_sum'] == 50 * (0 + 10 + 20 + 30)
+        assert events[0]['size_min'] == 0
+        assert events[0]['size_max'] == 30
+        assert events[0]['size_le_10'] == 100
+        assert events[0]['size_le_inf'] == 100
+        assert aggregate.flush() == 0
+    finally:
+        aggregate.store.close()
+        aggregate.store.unlink()
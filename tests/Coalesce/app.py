@@ -0,0 +1,41 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.coalesce import CoalescingAuditProvider
+from falcon_provider_audit.middleware import AuditMiddleware
+
+from ..Aggregate.app import ListAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {'request_method': 'method', 'request_path': 'path'},
+    'resp_fields': {'response_status': 'status'},
+    'timing_fields': {'request_duration_ms': 'duration_ms'},
+}
+
+
+class CoalesceResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'Audited'
+
+    def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support POST method."""
+        resp.status = falcon.HTTP_201
+
+
+list_provider = ListAuditProvider()
+coalesce_provider = CoalescingAuditProvider(
+    audit_control=audit_control,
+    provider=list_provider,
+    ignore_fields=['request_duration_ms'],
+    window=60,
+    interval=None,
+)
+
+app_coalesce_1 = falcon.App(middleware=[AuditMiddleware(providers=[coalesce_provider])])
+app_coalesce_1.add_route('/middleware', CoalesceResource1())
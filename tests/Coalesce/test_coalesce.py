@@ -0,0 +1,69 @@
+"""Test coalesce feature of falcon_provider_audit module."""
+# standard library
+import time
+
+# first-party
+from falcon_provider_audit.coalesce import CoalescingAuditProvider
+
+from ..Aggregate.app import ListAuditProvider
+from .app import coalesce_provider, list_provider
+
+
+def test_coalesce(client_coalesce_1: object) -> None:
+    """Testing coalesced audit events.
+
+    Args:
+        client_coalesce_1 (fixture): The test client.
+    """
+    coalesce_provider.flush()
+    list_provider.events.clear()
+
+    for _ in range(5):
+        assert client_coalesce_1.simulate_get('/middleware').status_code == 200
+    for _ in range(2):
+        assert client_coalesce_1.simulate_post('/middleware').status_code == 201
+
+    # events are held until the window ends
+    assert not list_provider.events
+    assert coalesce_provider.flush() == 2
+    events = {e['request_method']: e for e in list_provider.events}
+    assert events['GET']['count'] == 5
+    assert events['GET']['request_path'] == '/middleware'
+    assert events['GET']['response_status'] == '200 OK'
+    assert 'request_duration_ms' in events['GET']
+    assert events['GET']['first_seen'] <= events['GET']['last_seen'] <= time.time()
+    assert events['POST']['count'] == 2
+    assert events['POST']['response_status'] == '201 Created'
+
+    # nothing to flush
+    assert coalesce_provider.flush() == 0
+
+
+def test_coalesce_max_events() -> None:
+    """Testing coalesced audit events with more distinct events than max events."""
+    provider = ListAuditProvider()
+    coalesce = CoalescingAuditProvider(provider=provider, max_events=2, interval=None)
+    for user_id in [0, 1, 0, 2, 3]:
+        coalesce.add_event({'user_id': user_id, 'roles': ['admin']})
+
+    # user 1 is evicted by user 2 and user 0 by user 3 (least recently seen)
+    assert [(e['user_id'], e['count']) for e in provider.events] == [(1, 1), (0, 2)]
+    coalesce.close()
+    assert [(e['user_id'], e['count']) for e in provider.events[2:]] == [(2, 1), (3, 1)]
+
+
+def test_coalesce_window() -> None:
+    """Testing coalesced audit events are written when the window ends."""
+    provider = ListAuditProvider()
+    coalesce = CoalescingAuditProvider(provider=provider, window=0.1, interval=0.05)
+    for _ in range(3):
+        coalesce.add_event({'user_id': 'bob'})
+
+    deadline = time.time() + 5
+    while not provider.events and time.time() < deadline:
+        time.sleep(0.05)
+    coalesce.close()
+
+    assert len(provider.events) == 1
+    assert provider.events[0]['count'] == 3
+    assert provider.events[0]['last_seen'] - provider.events[0]['first_seen'] < 0.1
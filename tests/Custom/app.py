@@ -121,3 +121,29 @@ providers = [
 
 app_dual_2 = falcon.App(middleware=[AuditMiddleware(providers=providers)])
 app_dual_2.add_route('/middleware', DualResource2())
+
+
+class DualResource3:
+    """Memcache middleware testing resource."""
+
+    # only write audit events to the rotating logger provider
+    audit_control = {'provider_names': ['rotating_logger']}
+    my_audit_data = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        resp.text = f'Audited - {key}'
+        resp.set_header('content-type', 'application/json')
+        self.my_audit_data = key  # additional data to be added to audit event
+
+
+providers = [
+    DbAuditProvider(audit_control=audit_control),
+    RotatingLoggerAuditProvider(
+        audit_control=audit_control, filename='dual-audit.log', logger_name='DUAL'
+    ),
+]
+
+app_dual_3 = falcon.App(middleware=[AuditMiddleware(providers=providers)])
+app_dual_3.add_route('/middleware', DualResource3())
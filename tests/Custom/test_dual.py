@@ -97,3 +97,26 @@ def test_dual_disable_get(client_dual_2: object, log_directory: str, monkeypatch
     assert row is None  # nothing should be written to DB
     # check logfile
     assert has_text(logfile, key) is True  # search for unique string in logfile
+
+
+def test_dual_provider_names_get(client_dual_3: object, log_directory: str) -> None:
+    """Testing dual audit providers with provider_names set on resource.
+
+    Args:
+        client_dual_3 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'dual-audit.log')
+    key = f'{uuid4()}'
+    params = {'key': key}
+    response: Result = client_dual_3.simulate_get('/middleware', params=params)
+    assert response.status_code == 200
+    assert response.text == f'Audited - {key}'
+
+    # check db
+    row: object = (
+        session.query(AuditModel).filter_by(my_audit_data=key).first()  # pylint: disable=no-member
+    )
+    assert row is None  # db provider is not in provider_names
+    # check logfile
+    assert has_text(logfile, key) is True  # search for unique string in logfile
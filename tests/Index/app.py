@@ -0,0 +1,58 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.utils import RotatingLoggerAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {
+        'request_method': 'method',
+        'request_path': 'path',
+        'request_query_string': 'query_string',
+    },
+    'resp_fields': {
+        'response_content_type': 'headers.content-type',
+        'response_status': 'status',
+    },
+    'resource_fields': {'user_id': 'user_id'},
+}
+
+
+class IndexResource1:
+    """Audit middleware testing resource."""
+
+    user_id = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        resp.text = f'Audited - {key}'
+        resp.set_header('content-type', 'application/json')
+
+
+class IndexResource2:
+    """Audit middleware testing resource."""
+
+    # disable auditing for resource
+    audit_control = {'enabled': False}
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response, item_id: str) -> None:
+        """Support GET method."""
+        key: str = req.get_param('key')
+        resp.text = f'Audited - {key} {item_id}'
+
+
+providers = [
+    RotatingLoggerAuditProvider(
+        audit_control=audit_control, filename='index-audit.log', logger_name='INDEX'
+    )
+]
+
+middleware_index_1 = AuditMiddleware(providers=providers)
+app_index_1 = falcon.App(middleware=[middleware_index_1])
+app_index_1.add_route('/middleware', IndexResource1())
+app_index_1.add_route('/middleware/{item_id}/disabled', IndexResource2())
+audit_index_1 = middleware_index_1.index_routes(app_index_1)
@@ -0,0 +1,115 @@
+"""Test route index feature of falcon_provider_audit module."""
+# standard library
+import os
+from uuid import uuid4
+
+# third-party
+import falcon
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+
+# required for monkeypatch
+from .app import IndexResource1, audit_index_1, providers
+
+
+def has_text(logfile: str, text: str) -> bool:
+    """Search for unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        bool: True if text is found, else False.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                break
+        else:
+            return False
+    return True
+
+
+def test_index() -> None:
+    """Testing audit index built from the app routes."""
+    assert sorted(audit_index_1) == ['/middleware', '/middleware/{item_id}/disabled']
+    assert audit_index_1['/middleware/{item_id}/disabled'] is False
+
+    # a single active provider with the compiled fields
+    provider, fields, event_limit = audit_index_1['/middleware'][0]
+    assert provider.name == 'rotating_logger'
+    assert event_limit is None
+    assert [label for label, _, _ in fields] == [
+        'request_method',
+        'request_path',
+        'request_query_string',
+        'user_id',
+        'response_content_type',
+        'response_status',
+    ]
+
+
+def test_index_get(client_index_1: object, log_directory: str, monkeypatch: object) -> None:
+    """Testing GET resource with a prebuilt audit index.
+
+    Args:
+        client_index_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+        monkeypatch (fixture): The monkeypatch object.
+    """
+    user_id = f'{uuid4()}'  # unique value to check for in logs
+    monkeypatch.setattr(IndexResource1, 'user_id', user_id)
+
+    logfile: str = os.path.join(log_directory, 'index-audit.log')
+    key = f'{uuid4()}'
+    response: Result = client_index_1.simulate_get('/middleware', params={'key': key})
+    assert response.status_code == 200
+    assert has_text(logfile, key) is True
+    assert has_text(logfile, user_id) is True
+
+    key = f'{uuid4()}'
+    response: Result = client_index_1.simulate_get('/middleware/1/disabled', params={'key': key})
+    assert response.status_code == 200
+    assert has_text(logfile, key) is False
+
+
+@pytest.mark.parametrize(
+    'audit_control,error',
+    [
+        ({'req_feilds': {'request_path': 'path'}}, "Invalid audit control key(s) ['req_feilds']"),
+        ({'req_fields': {'request_path': 'paths'}}, 'Invalid audit field request_path="paths"'),
+        ({'resource_fields': {'user': 'user_name'}}, 'Invalid audit field user="user_name"'),
+        ({'rotating_logger': {'resp_fields': {'x': 'bogus.0'}}}, 'Invalid audit field x="bogus.0"'),
+        ({'timing_fields': {'duration': 'duration'}}, 'Invalid audit field duration="duration"'),
+        ({'redact': {'request_user': 'drop'}}, "Invalid redact label(s) ['request_user']"),
+        ({'truncate': {'request_user': 10}}, "Invalid truncate label(s) ['request_user']"),
+    ],
+)
+def test_index_invalid(audit_control: dict, error: str) -> None:
+    """Testing audit index with an invalid resource audit control.
+
+    Args:
+        audit_control: The resource audit control.
+        error: The expected error message.
+    """
+
+    class InvalidResource:
+        """Audit middleware testing resource."""
+
+        user_id = None
+
+        def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+            """Support GET method."""
+
+    InvalidResource.audit_control = audit_control
+
+    middleware = AuditMiddleware(providers=providers)
+    app = falcon.App(middleware=[middleware])
+    app.add_route('/invalid', InvalidResource())
+    with pytest.raises(ValueError) as exc_info:
+        middleware.index_routes(app)
+    assert error in str(exc_info.value)
@@ -0,0 +1,38 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.utils import RotatingLoggerAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {
+        'request_path': 'path',
+        'request_query_string': 'query_string',
+        'request_referer': 'referer',
+        'request_user_agent': 'user_agent',
+    },
+    'max_event_bytes': 256,
+    'max_field_bytes': 128,
+    'truncate': {'request_user_agent': 32},
+}
+
+
+class LimitsResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'Audited'
+
+
+providers = [
+    RotatingLoggerAuditProvider(
+        audit_control=audit_control, filename='limits-audit.log', logger_name='LIMITS'
+    )
+]
+
+app_limits_1 = falcon.App(middleware=[AuditMiddleware(providers=providers)])
+app_limits_1.add_route('/middleware', LimitsResource1())
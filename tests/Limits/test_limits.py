@@ -0,0 +1,119 @@
+"""Test size limits feature of falcon_provider_audit module."""
+# standard library
+import os
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_audit.limits import AuditLimits
+
+from .app import providers
+
+
+def get_line(logfile: str, text: str) -> str | None:
+    """Return the line containing the unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        str: The matching line.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                return line
+    return None
+
+
+def test_limits_field(client_limits_1: object, log_directory: str) -> None:
+    """Testing field size limits.
+
+    Args:
+        client_limits_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    provider = providers[0]
+    truncated_fields: int = provider.truncated_fields
+
+    logfile: str = os.path.join(log_directory, 'limits-audit.log')
+    key = f'{uuid4()}'
+    headers = {'user-agent': 'a' * 100}
+    response: Result = client_limits_1.simulate_get(
+        '/middleware', params={'key': key, 'pad': 'b' * 200}, headers=headers
+    )
+    assert response.status_code == 200
+
+    line: str = get_line(logfile, key)
+    query_string = f'key={key}&pad='
+    query_string += 'b' * (128 - len(query_string) - len('[truncated]')) + '[truncated]'
+    assert f'request_query_string="{query_string}"' in line
+    assert f'request_user_agent="{"a" * 21}[truncated]"' in line
+    assert provider.truncated_fields == truncated_fields + 2
+
+
+def test_limits_event(client_limits_1: object, log_directory: str) -> None:
+    """Testing event size limits.
+
+    Args:
+        client_limits_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    provider = providers[0]
+    truncated_events: int = provider.truncated_events
+
+    logfile: str = os.path.join(log_directory, 'limits-audit.log')
+    key = f'{uuid4()}'
+    headers = {'referer': 'r' * 500}
+    response: Result = client_limits_1.simulate_get(
+        '/middleware', params={'key': key}, headers=headers
+    )
+    assert response.status_code == 200
+
+    # the user agent is the last field and is truncated to fit in the event budget
+    line: str = get_line(logfile, key)
+    assert f'request_referer="{"r" * 117}[truncated]"' in line
+    assert 'request_user_agent="f[truncated]"' in line
+    assert provider.truncated_events == truncated_events + 1
+
+
+@pytest.mark.parametrize(
+    'value,max_bytes,expected',
+    [
+        ('abcdef', 6, 'abcdef'),
+        ('abcdef', 5, 'ab...'),
+        ('abcdef', 2, '...'),
+        ('ééé', 5, 'é...'),
+        ('é' * 3, 6, 'ééé'),
+    ],
+)
+def test_limits_truncate(value: str, max_bytes: int, expected: str) -> None:
+    """Testing truncate of string values.
+
+    Args:
+        value: The value to truncate.
+        max_bytes: The maximum size of the value.
+        expected: The truncated value.
+    """
+    assert AuditLimits.truncate(value, max_bytes, '...') == expected
+
+
+def test_limits_truncate_list() -> None:
+    """Testing truncate of list values."""
+    value = ['10.0.0.1', '10.0.0.2', '10.0.0.3']
+    assert AuditLimits.truncate_list(value, 100, '...') is value
+    assert AuditLimits.truncate_list(value, 20, '...') == ['10.0.0.1', '...']
+
+
+def test_limits_event_budget() -> None:
+    """Testing event budget."""
+    event = {'a': 'x' * 10, 'b': 'y' * 10, 'c': 5}
+    assert AuditLimits.limit_event(event, 30, '...') is False
+
+    event = {'a': 'x' * 10, 'b': 'y' * 10, 'c': 'z' * 10}
+    assert AuditLimits.limit_event(event, 20, '...') is True
+    assert event == {'a': 'x' * 10, 'b': 'yyyyy...', 'c': '...'}
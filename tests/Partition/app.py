@@ -0,0 +1,36 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.partition import PartitionedFileAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {
+        'request_path': 'path',
+        'request_query_string': 'query_string',
+        'tenant': 'context.tenant',
+    },
+}
+
+
+class PartitionResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        req.context.tenant = req.get_header('X-Tenant')
+        resp.text = 'Audited'
+
+
+partition_provider = PartitionedFileAuditProvider(
+    audit_control=audit_control,
+    directory='log/partition',
+    interval=None,
+    path_template='{tenant}/{date}.log',
+)
+
+app_partition_1 = falcon.App(middleware=[AuditMiddleware(providers=[partition_provider])])
+app_partition_1.add_route('/middleware', PartitionResource1())
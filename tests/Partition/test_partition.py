@@ -0,0 +1,92 @@
+"""Test partition feature of falcon_provider_audit module."""
+# standard library
+import os
+import time
+from uuid import uuid4
+
+# first-party
+from falcon_provider_audit.partition import PartitionedFileAuditProvider
+
+from .app import partition_provider
+
+
+def has_text(logfile: str, text: str) -> bool:
+    """Return True if the text is in the log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        bool: True if the text is found.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        return text in fh.read()
+
+
+def test_partition(client_partition_1: object, log_directory: str) -> None:
+    """Testing events are written to the partition of the tenant.
+
+    Args:
+        client_partition_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    date = time.strftime('%Y-%m-%d')
+    texts = {}
+    for tenant in ['acme', 'globex', '../etc']:
+        texts[tenant] = str(uuid4())
+        params = {'query_string': f'id={texts[tenant]}', 'headers': {'X-Tenant': tenant}}
+        assert client_partition_1.simulate_get('/middleware', **params).status_code == 200
+    assert client_partition_1.simulate_get('/middleware').status_code == 200
+
+    # the events are buffered until flushed
+    partition_provider.flush()
+
+    directory = os.path.join(log_directory, 'partition')
+    assert has_text(os.path.join(directory, 'acme', f'{date}.log'), texts['acme'])
+    assert has_text(os.path.join(directory, 'globex', f'{date}.log'), texts['globex'])
+    assert not has_text(os.path.join(directory, 'acme', f'{date}.log'), texts['globex'])
+    # path separators and leading dots are removed from the value
+    assert has_text(os.path.join(directory, '_etc', f'{date}.log'), texts['../etc'])
+    # the default value is used for a missing value
+    assert os.path.isfile(os.path.join(directory, 'unknown', f'{date}.log'))
+
+
+def test_partition_max_handles(tmp_path: object) -> None:
+    """Testing the least recently used partition is closed when max handles is reached."""
+    provider = PartitionedFileAuditProvider(
+        directory=str(tmp_path), interval=None, max_handles=2, path_template='{user_id}.log'
+    )
+    for user_id in ['bob', 'alice', 'bob', 'eve']:
+        provider.add_event({'user_id': user_id})
+
+    # alice was the least recently used partition and is written when closed
+    assert [os.path.basename(f) for f in provider.partitions] == ['bob.log', 'eve.log']
+    assert has_text(os.path.join(tmp_path, 'alice.log'), 'user_id="alice"')
+    assert not os.path.getsize(os.path.join(tmp_path, 'bob.log'))
+
+    provider.close()
+    assert not provider.partitions
+    with open(os.path.join(tmp_path, 'bob.log'), encoding='utf-8') as fh:
+        assert fh.read().count('user_id="bob"') == 2
+
+
+def test_partition_rotate(tmp_path: object) -> None:
+    """Testing partition files are rotated at max bytes."""
+    provider = PartitionedFileAuditProvider(
+        backup_count=2,
+        buffer_size=0,
+        directory=str(tmp_path),
+        interval=None,
+        max_bytes=100,
+        path_template='{user_id}.log',
+    )
+    for i in range(10):
+        provider.add_event({'user_id': 'bob', 'request_id': f'{i:040d}'})
+    provider.close()
+
+    logfile = os.path.join(tmp_path, 'bob.log')
+    assert sorted(os.listdir(tmp_path)) == ['bob.log', 'bob.log.1', 'bob.log.2']
+    assert has_text(logfile, f'{9:040d}')
+    assert has_text(f'{logfile}.2', f'{7:040d}')
+    assert all(os.path.getsize(f'{logfile}{s}') <= 100 for s in ['', '.1', '.2'])
@@ -0,0 +1,47 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.utils import RotatingLoggerAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {
+        'request_path': 'path',
+        'request_query_string': 'query_string',
+        'request_remote_addr': 'remote_addr',
+        'request_user_agent': 'user_agent',
+    },
+    'resource_fields': {'user_id': 'user_id'},
+    'redact': {
+        'request_path': {'action': 'replace', 'pattern': r'/\d+', 'repl': '/{id}'},
+        'request_query_string': {'action': 'allowlist', 'params': ['key', 'page']},
+        'request_remote_addr': {'action': 'hmac', 'key': 'secret'},
+        'request_user_agent': 'drop',
+        'user_id': {'action': 'mask', 'keep': 4},
+    },
+}
+
+
+class RedactResource1:
+    """Audit middleware testing resource."""
+
+    user_id = None
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response, item_id: int) -> None:
+        """Support GET method."""
+        resp.text = f'Audited - {item_id}'
+
+
+providers = [
+    RotatingLoggerAuditProvider(
+        audit_control=audit_control, filename='redact-audit.log', logger_name='REDACT'
+    )
+]
+
+middleware_redact_1 = AuditMiddleware(providers=providers)
+app_redact_1 = falcon.App(middleware=[middleware_redact_1])
+app_redact_1.add_route('/middleware/{item_id:int}', RedactResource1())
+middleware_redact_1.index_routes(app_redact_1)
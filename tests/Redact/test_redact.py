@@ -0,0 +1,102 @@
+"""Test redaction feature of falcon_provider_audit module."""
+# standard library
+import hashlib
+import hmac
+import os
+from uuid import uuid4
+
+# third-party
+import pytest
+from falcon.testing import Result
+
+# first-party
+from falcon_provider_audit.redact import AuditRedaction
+
+# required for monkeypatch
+from .app import RedactResource1
+
+
+def get_line(logfile: str, text: str) -> str | None:
+    """Return the line containing the unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        str: The matching line.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                return line
+    return None
+
+
+def test_redact_get(client_redact_1: object, log_directory: str, monkeypatch: object) -> None:
+    """Testing redaction rules.
+
+    Args:
+        client_redact_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+        monkeypatch (fixture): The monkeypatch object.
+    """
+    monkeypatch.setattr(RedactResource1, 'user_id', 'bob-1234')
+
+    logfile: str = os.path.join(log_directory, 'redact-audit.log')
+    key = f'{uuid4()}'
+    params = {'key': key, 'page': 2, 'token': 'secret-token'}
+    response: Result = client_redact_1.simulate_get('/middleware/123', params=params)
+    assert response.status_code == 200
+
+    line: str = get_line(logfile, key)
+    remote_addr = hmac.new(b'secret', b'127.0.0.1', hashlib.sha256).hexdigest()
+    assert 'request_path="/middleware/{id}"' in line
+    assert f'request_query_string="key={key}&page=2"' in line
+    assert f'request_remote_addr="{remote_addr}"' in line
+    assert 'request_user_agent' not in line
+    assert 'user_id="****1234"' in line
+    assert 'secret-token' not in line
+
+
+@pytest.mark.parametrize(
+    'rule,value,expected',
+    [
+        ('mask', 'secret', '******'),
+        ({'action': 'mask', 'char': '#', 'keep': 2}, 'secret', '####et'),
+        ({'action': 'mask', 'keep': 10}, 'secret', 'secret'),
+        ({'action': 'replace', 'pattern': r'\d'}, 'a1b2', 'a***b***'),
+        ({'action': 'allowlist', 'params': ['a'], 'replacement': 'x'}, 'a=1&b=2', 'a=1&b=x'),
+        ({'action': 'allowlist', 'params': []}, 'a=1&b=2', ''),
+        ('mask', None, None),
+        ('mask', ['abc', 'de'], ['***', '**']),
+    ],
+)
+def test_redact_rules(rule: dict | str, value: object, expected: object) -> None:
+    """Testing redaction rules.
+
+    Args:
+        rule: The redaction rule.
+        value: The field value.
+        expected: The redacted value.
+    """
+    redact = AuditRedaction.compile(rule, lambda obj: obj)
+    assert redact(value) == expected
+
+
+def test_redact_drop() -> None:
+    """Testing drop redaction rule."""
+    assert AuditRedaction.compile('drop', lambda obj: obj) is None
+
+
+@pytest.mark.parametrize(
+    'rule', ['bogus', {'action': 'hmac'}, {'action': 'replace', 'pattern': '('}]
+)
+def test_redact_invalid(rule: dict | str) -> None:
+    """Testing invalid redaction rules.
+
+    Args:
+        rule: The redaction rule.
+    """
+    with pytest.raises(ValueError):
+        AuditRedaction.compile(rule, lambda obj: obj)
@@ -0,0 +1,32 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.ring import RingBufferAuditProvider, RingBufferResource
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {'request_path': 'path', 'request_query_string': 'query_string'},
+    'resp_fields': {'response_status': 'status'},
+    'resource_fields': {'user_id': 'user_id'},
+}
+
+
+class RingResource1:
+    """Audit middleware testing resource."""
+
+    user_id = 'bob'
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response, status: int) -> None:
+        """Support GET method."""
+        resp.status = falcon.code_to_http_status(status)
+        resp.text = 'Audited'
+
+
+ring_provider = RingBufferAuditProvider(audit_control=audit_control, size=4)
+
+app_ring_1 = falcon.App(middleware=[AuditMiddleware(providers=[ring_provider])])
+app_ring_1.add_route('/middleware/{status:int}', RingResource1())
+app_ring_1.add_route('/audit/recent', RingBufferResource(ring_provider))
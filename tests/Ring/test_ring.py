@@ -0,0 +1,60 @@
+"""Test ring buffer feature of falcon_provider_audit module."""
+# standard library
+import threading
+
+# first-party
+from falcon_provider_audit.ring import RingBufferAuditProvider
+
+from .app import ring_provider
+
+
+def test_ring(client_ring_1: object) -> None:
+    """Testing the recent events are served by the ring buffer resource.
+
+    Args:
+        client_ring_1 (fixture): The test client.
+    """
+    ring_provider.clear()
+    for i, status in enumerate([200, 404, 200, 500, 404]):
+        params = {'query_string': f'i={i}'}
+        assert client_ring_1.simulate_get(f'/middleware/{status}', **params).status_code == status
+
+    # the oldest event was overwritten
+    events = client_ring_1.simulate_get('/audit/recent').json['events']
+    assert [e['request_query_string'] for e in events] == ['i=4', 'i=3', 'i=2', 'i=1']
+    assert events[0]['response_status'] == '404 Not Found'
+    assert events[0]['user_id'] == 'bob'
+    assert events[0]['audit_seq'] > events[1]['audit_seq']
+
+    events = client_ring_1.simulate_get('/audit/recent', params={'status': '404'}).json['events']
+    assert [e['request_query_string'] for e in events] == ['i=4', 'i=1']
+
+    params = {'path': '/middleware/200', 'limit': 1}
+    events = client_ring_1.simulate_get('/audit/recent', params=params).json['events']
+    assert [e['request_query_string'] for e in events] == ['i=2']
+
+    events = client_ring_1.simulate_get('/audit/recent', params={'user': 'alice'}).json['events']
+    assert not events
+
+    # requests to the ring buffer resource are not audited
+    assert len(ring_provider) == 4
+
+
+def test_ring_threads() -> None:
+    """Testing the ring buffer never grows beyond its size with concurrent writers."""
+    provider = RingBufferAuditProvider(size=100)
+
+    def worker(worker_id: int) -> None:
+        """Add events from a thread."""
+        for i in range(1_000):
+            provider.add_event({'worker_id': worker_id, 'i': i})
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    events = provider.events()
+    assert len(events) == len(provider._slots) == 100  # pylint: disable=protected-access
+    assert [e['audit_seq'] for e in events] == list(range(3_999, 3_899, -1))
@@ -28,6 +28,11 @@ audit_control = {
         'response_status': 'status',
     },
     'resource_fields': {'user_id': 'user_id'},
+    'timing_fields': {
+        'request_duration_ms': 'duration_ms',
+        'request_resource_time': 'resource_time',
+        'request_start_time': 'start_time',
+    },
 }
 
 
@@ -83,7 +88,8 @@ class RotatingLoggerResource2:
 
 providers = [RotatingLoggerAuditProvider(audit_control=audit_control, logger_name='ROT2')]
 
-app_rotating_logger_2 = falcon.App(middleware=[AuditMiddleware(providers=providers)])
+middleware_rotating_logger_2 = AuditMiddleware(providers=providers)
+app_rotating_logger_2 = falcon.App(middleware=[middleware_rotating_logger_2])
 app_rotating_logger_2.add_route('/middleware', RotatingLoggerResource2())
 
 
@@ -1,13 +1,15 @@
 """Test hooks feature of falcon_provider_memcache module."""
 # standard library
 import os
+import re
+import time
 from uuid import uuid4
 
 # third-party
 from falcon.testing import Result
 
 # required for monkeypatch
-from .app import RotatingLoggerResource1, RotatingLoggerResource2
+from .app import RotatingLoggerResource1, RotatingLoggerResource2, middleware_rotating_logger_2
 
 
 def has_text(logfile: str, text: str) -> bool:
@@ -51,6 +53,27 @@ def test_default_get(client_rotating_logger_1: object, log_directory: str, monke
     assert has_text(logfile, key) is True  # search for unique string in logfile
 
 
+def test_timing_get(client_rotating_logger_1: object, log_directory: str):
+    """Testing timing fields.
+
+    Args:
+        client_rotating_logger_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'audit.log')
+    key = f'{uuid4()}'
+    start = time.time()
+    response: Result = client_rotating_logger_1.simulate_get('/middleware', params={'key': key})
+    assert response.status_code == 200
+
+    with open(logfile, encoding='utf-8') as fh:
+        line = [line for line in fh.read().strip().split('\n') if key in line][0]
+    timing = dict(re.findall(r'(request_[a-z_]+_time|request_duration_ms)="([0-9.e-]+)"', line))
+    assert 0 <= float(timing['request_resource_time']) <= float(timing['request_duration_ms'])
+    assert float(timing['request_duration_ms']) < 1_000
+    assert start - 1 < float(timing['request_start_time']) < time.time()
+
+
 def test_default_post(client_rotating_logger_1: object, log_directory: str, monkeypatch: object):
     """Testing POST resource
 
@@ -108,6 +131,8 @@ def test_disabled(client_rotating_logger_2: object, log_directory: str, monkeypa
     monkeypatch.setattr(RotatingLoggerResource2, 'user_id', user_id, raising=False)
     # disable auditing
     monkeypatch.setitem(RotatingLoggerResource2.audit_control, 'enabled', False)
+    # audit control is resolved once per resource, use an empty plan cache for this test
+    monkeypatch.setattr(middleware_rotating_logger_2, '_resource_plans', {})
 
     logfile: str = os.path.join(log_directory, 'audit.log')
     key = f'{uuid4()}'
@@ -0,0 +1,32 @@
+"""Falcon app used for testing."""
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.shipper import HttpBatchAuditProvider
+
+from .http_server import TestCollectorServer
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {'request_path': 'path', 'request_query_string': 'query_string'},
+    'resp_fields': {'response_status': 'status'},
+}
+
+
+class ShipperResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        resp.text = 'Audited'
+
+
+collector = TestCollectorServer().start()
+http_provider = HttpBatchAuditProvider(
+    audit_control=audit_control, url=collector.url, batch_size=10, interval=None, backoff=0.01
+)
+
+app_shipper_1 = falcon.App(middleware=[AuditMiddleware(providers=[http_provider])])
+app_shipper_1.add_route('/middleware', ShipperResource1())
@@ -0,0 +1,61 @@
+"""HTTP collector server module"""
+# standard library
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class TestCollectorServer:
+    """Test HTTP collector that records the received NDJSON events."""
+
+    def __init__(self, address: str = '127.0.0.1', port: int = 0) -> None:
+        """Initialize Class properties.
+
+        Args:
+            address: The address for the server to listen.
+            port: The port for the server to listen (0 for any free port).
+        """
+        self.events: list[dict] = []
+        self.clients: set[tuple] = set()
+        self.requests = 0
+        # the status codes returned for the next requests (e.g., [503] to test retry)
+        self.statuses: list[int] = []
+
+        collector = self  # add collector to local scope
+
+        class Handler(BaseHTTPRequestHandler):
+            """NDJSON Handler"""
+
+            protocol_version = 'HTTP/1.1'
+
+            def do_POST(self):  # pylint: disable=invalid-name
+                """Record the events of the batch."""
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                collector.requests += 1
+                collector.clients.add(self.client_address)
+                status = collector.statuses.pop(0) if collector.statuses else 200
+                if status == 200:
+                    assert self.headers['Content-Encoding'] == 'gzip'
+                    for line in gzip.decompress(body).splitlines():
+                        collector.events.append(json.loads(line))
+                self.send_response(status)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Suppress request logging."""
+
+        self.server = ThreadingHTTPServer((address, port), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://{address}:{self.server.server_address[1]}/v1/audit'
+
+    def start(self) -> 'TestCollectorServer':
+        """Start the server in a daemon thread."""
+        threading.Thread(name='collector', target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,81 @@
+"""Test HTTP shipper feature of falcon_provider_audit module."""
+# standard library
+import time
+
+# third-party
+import pytest
+
+# first-party
+from falcon_provider_audit.shipper import HttpBatchAuditProvider
+
+from .app import collector, http_provider
+from .http_server import TestCollectorServer
+
+
+def test_shipper(client_shipper_1: object) -> None:
+    """Testing audit events are shipped in batches.
+
+    Args:
+        client_shipper_1 (fixture): The test client.
+    """
+    collector.events.clear()
+    requests = collector.requests
+    for i in range(25):
+        params = {'query_string': f'i={i}'}
+        assert client_shipper_1.simulate_get('/middleware', **params).status_code == 200
+
+    # two full batches are sent, the partial batch is sent on flush
+    http_provider.flush(wait=True)
+    assert collector.requests - requests == 3
+    assert sorted(e['request_query_string'] for e in collector.events) == sorted(
+        f'i={i}' for i in range(25)
+    )
+    assert collector.events[0]['response_status'] == '200 OK'
+    # the batches are sent over the persistent connections of the pool
+    assert len(collector.clients) <= http_provider.pool_size
+
+
+def test_shipper_retry() -> None:
+    """Testing a failed batch is retried and a rejected batch is dropped."""
+    server = TestCollectorServer().start()
+    provider = HttpBatchAuditProvider(
+        url=server.url, batch_size=100, interval=None, pool_size=1, retries=2, backoff=0.01
+    )
+    try:
+        server.statuses = [503, 500]
+        provider.add_event({'user_id': 'bob'})
+        provider.flush(wait=True)
+        assert server.requests == 3
+        assert [e['user_id'] for e in server.events] == ['bob']
+
+        server.statuses = [400]
+        provider.add_event({'user_id': 'alice'})
+        provider.flush(wait=True)
+        assert server.requests == 4
+        assert provider.sent_events == 1
+        assert provider.dropped_events == 1
+    finally:
+        provider.close()
+        server.stop()
+
+
+def test_shipper_unavailable() -> None:
+    """Testing events are dropped when the collector is unavailable."""
+    server = TestCollectorServer()
+    url = server.url
+    # the server is not started, close the socket so the port refuses connections
+    server.server.server_close()
+
+    provider = HttpBatchAuditProvider(url=url, interval=0.01, retries=1, backoff=0.01)
+    provider.add_event({'user_id': 'bob'})
+    deadline = time.time() + 5
+    while not provider.dropped_events and time.time() < deadline:
+        time.sleep(0.01)
+    provider.close()
+    assert provider.dropped_events == 1
+
+
+def test_shipper_invalid_url() -> None:
+    """Testing an invalid collector url."""
+    with pytest.raises(ValueError):
+        HttpBatchAuditProvider(url='ftp://localhost/')
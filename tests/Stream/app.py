@@ -0,0 +1,85 @@
+"""Falcon app used for testing."""
+# standard library
+import io
+
+# third-party
+import falcon
+
+# first-party
+from falcon_provider_audit.middleware import AuditMiddleware
+from falcon_provider_audit.utils import RotatingLoggerAuditProvider
+
+audit_control = {
+    'enabled': True,
+    'req_fields': {'request_query_string': 'query_string'},
+    'resp_fields': {
+        'response_bytes': 'context.audit_stream_bytes',
+        'response_content_length': 'headers.content-length',
+        'response_sha256': 'context.audit_stream_hash',
+    },
+}
+
+
+class StreamResource1:
+    """Audit middleware testing resource."""
+
+    def on_get(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support GET method."""
+        size: int = req.get_param_as_int('size', default=0)
+        resp.stream = (b'x' * 1_000 for _ in range(size))
+
+    def on_head(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support HEAD method."""
+        resp.stream = io.BytesIO(b'z')
+
+    def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support POST method."""
+        size: int = req.get_param_as_int('size', default=0)
+        resp.stream = io.BytesIO(b'y' * size)
+
+    def on_put(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support PUT method."""
+        resp.text = 'Audited'
+
+
+providers = [
+    RotatingLoggerAuditProvider(
+        audit_control=audit_control, filename='stream-audit.log', logger_name='STREAM'
+    )
+]
+
+app_stream_1 = falcon.App(
+    middleware=[AuditMiddleware(providers=providers, stream_audit=True, stream_hash='sha256')]
+)
+app_stream_1.add_route('/middleware', StreamResource1())
+
+
+class BodyResource1:
+    """Audit middleware testing resource."""
+
+    def on_post(self, req: falcon.Request, resp: falcon.Response) -> None:
+        """Support POST method."""
+        data: bytes = req.bounded_stream.read()
+        resp.text = f'Received {len(data)} bytes'
+
+
+body_audit_control = {
+    'enabled': True,
+    'req_fields': {
+        'body_sha256': 'context.audit_body_hash',
+        'body_size': 'context.audit_body_size',
+        'request_query_string': 'query_string',
+    },
+}
+body_providers = [
+    RotatingLoggerAuditProvider(
+        audit_control=body_audit_control, filename='body-audit.log', logger_name='BODY'
+    )
+]
+
+app_body_1 = falcon.App(
+    middleware=[
+        AuditMiddleware(providers=body_providers, body_hash='sha256', body_hash_max_bytes=1_000)
+    ]
+)
+app_body_1.add_route('/middleware', BodyResource1())
@@ -0,0 +1,122 @@
+"""Test stream feature of falcon_provider_audit module."""
+# standard library
+import hashlib
+import os
+from uuid import uuid4
+
+# third-party
+from falcon.testing import Result
+
+
+def get_line(logfile: str, text: str) -> str | None:
+    """Return the line containing the unique text in log file.
+
+    Args:
+        logfile: The fully qualified path to the logfile.
+        text: The text to search for in the logfile.
+
+    Returns:
+        str: The matching line.
+    """
+    with open(logfile, encoding='utf-8') as fh:
+        for line in fh.read().strip().split('\n'):
+            if text in line:
+                return line
+    return None
+
+
+def test_stream_iterable(client_stream_1: object, log_directory: str) -> None:
+    """Testing bytes sent for an iterable stream.
+
+    Args:
+        client_stream_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'stream-audit.log')
+    key = f'{uuid4()}'
+    response: Result = client_stream_1.simulate_get('/middleware', params={'key': key, 'size': 64})
+    assert response.status_code == 200
+    assert len(response.content) == 64_000
+
+    line: str = get_line(logfile, key)
+    assert 'response_bytes="64000"' in line
+    assert 'response_content_length="None"' in line
+    assert f'response_sha256="{hashlib.sha256(response.content).hexdigest()}"' in line
+
+
+def test_stream_file(client_stream_1: object, log_directory: str) -> None:
+    """Testing bytes sent for a file-like stream.
+
+    Args:
+        client_stream_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'stream-audit.log')
+    key = f'{uuid4()}'
+    response: Result = client_stream_1.simulate_post('/middleware', params={'key': key, 'size': 10})
+    assert response.status_code == 200
+    assert response.content == b'y' * 10
+
+    line: str = get_line(logfile, key)
+    assert 'response_bytes="10"' in line
+    assert f'response_sha256="{hashlib.sha256(b"y" * 10).hexdigest()}"' in line
+
+
+def test_stream_not_streamed(client_stream_1: object, log_directory: str) -> None:
+    """Testing audit event for responses without a stream.
+
+    Args:
+        client_stream_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'stream-audit.log')
+    key = f'{uuid4()}'
+    response: Result = client_stream_1.simulate_put('/middleware', params={'key': key})
+    assert response.status_code == 200
+
+    line: str = get_line(logfile, key)
+    assert 'response_bytes="None"' in line
+
+    # HEAD requests never read the stream, the event must not be deferred
+    key = f'{uuid4()}'
+    response: Result = client_stream_1.simulate_head('/middleware', params={'key': key})
+    assert response.status_code == 200
+    assert get_line(logfile, key) is not None
+
+
+def test_body_hash(client_body_1: object, log_directory: str) -> None:
+    """Testing request body hash.
+
+    Args:
+        client_body_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'body-audit.log')
+    body = os.urandom(1_000)
+    key = f'{uuid4()}'
+    response: Result = client_body_1.simulate_post('/middleware', params={'key': key}, body=body)
+    assert response.status_code == 200
+    assert response.text == 'Received 1000 bytes'
+
+    line: str = get_line(logfile, key)
+    assert 'body_size="1000"' in line
+    assert f'body_sha256="{hashlib.sha256(body).hexdigest()}"' in line
+
+
+def test_body_hash_max_bytes(client_body_1: object, log_directory: str) -> None:
+    """Testing request body hash with a body larger than max bytes.
+
+    Args:
+        client_body_1 (fixture): The test client.
+        log_directory (fixture): The fully qualified path for the log directory.
+    """
+    logfile: str = os.path.join(log_directory, 'body-audit.log')
+    key = f'{uuid4()}'
+    response: Result = client_body_1.simulate_post(
+        '/middleware', params={'key': key}, body=os.urandom(1_001)
+    )
+    assert response.status_code == 200
+
+    line: str = get_line(logfile, key)
+    assert 'body_size="1001"' in line
+    assert 'body_sha256="None"' in line
@@ -1,13 +1,14 @@
 """Testing conf module."""
 # standard library
 import os
+import shutil
 import threading
 
 # third-party
 import pytest
 from falcon import testing
 
-from .Custom.app import app_db_1, app_dual_1, app_dual_2
+from .Custom.app import app_db_1, app_dual_1, app_dual_2, app_dual_3
 from .Syslog.syslog_server import TestSyslogServers
 
 # the log directory for all test cases
@@ -17,6 +18,30 @@ tcp_server = test_syslog.start_tcp_server(port=5141)
 udp_server = test_syslog.start_udp_server(port=5140)
 
 
+@pytest.fixture
+def client_aggregate_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Aggregate.app import app_aggregate_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_aggregate_1)
+
+
+@pytest.fixture
+def client_body_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Stream.app import app_body_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_body_1)
+
+
+@pytest.fixture
+def client_coalesce_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Coalesce.app import app_coalesce_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_coalesce_1)
+
+
 @pytest.fixture
 def client_db_1() -> testing.TestClient:
     """Create testing client"""
@@ -35,6 +60,52 @@ def client_dual_2() -> testing.TestClient:
     return testing.TestClient(app_dual_2)
 
 
+@pytest.fixture
+def client_dual_3() -> testing.TestClient:
+    """Create testing client"""
+    return testing.TestClient(app_dual_3)
+
+
+@pytest.fixture
+def client_index_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Index.app import app_index_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_index_1)
+
+
+@pytest.fixture
+def client_limits_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Limits.app import app_limits_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_limits_1)
+
+
+@pytest.fixture
+def client_partition_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Partition.app import app_partition_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_partition_1)
+
+
+@pytest.fixture
+def client_redact_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Redact.app import app_redact_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_redact_1)
+
+
+@pytest.fixture
+def client_ring_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Ring.app import app_ring_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_ring_1)
+
+
 @pytest.fixture
 def client_rotating_logger_1() -> testing.TestClient:
     """Create testing client"""
@@ -55,6 +126,22 @@ def client_rotating_logger_2() -> testing.TestClient:
     return testing.TestClient(app_rotating_logger_2)
 
 
+@pytest.fixture
+def client_shipper_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Shipper.app import app_shipper_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_shipper_1)
+
+
+@pytest.fixture
+def client_stream_1() -> testing.TestClient:
+    """Create testing client"""
+    from .Stream.app import app_stream_1  # pylint: disable=import-outside-toplevel
+
+    return testing.TestClient(app_stream_1)
+
+
 @pytest.fixture
 def client_tcp_logger_1() -> testing.TestClient:
     """Create testing client"""
@@ -107,8 +194,5 @@ def pytest_configure() -> None:
 def pytest_unconfigure(config) -> None:  # pylint: disable=unused-argument
     """Clear the log directory after tests are complete"""
     if os.path.isdir(_LOG_DIRECTORY):
-        for log_file in os.listdir(_LOG_DIRECTORY):
-            file_path = os.path.join(_LOG_DIRECTORY, log_file)
-            if os.path.isfile(file_path):
-                os.unlink(file_path)
-        os.rmdir(_LOG_DIRECTORY)
+        # partitioned providers write to sub directories
+        shutil.rmtree(_LOG_DIRECTORY)